@@ -1,5 +1,6 @@
 import logging
 import statistics
+import numpy as np
 
 def analyze_single_distribution(feature_name, distribution, context, threshold=2.0):
     '''
@@ -21,14 +22,17 @@ def analyze_single_distribution(feature_name, distribution, context, threshold=2
     stdev_val = statistics.stdev(values)
     if stdev_val == 0:
         return
-    for key, count in distribution.items():
-        z_score = (count - mean_val) / stdev_val
-        if abs(z_score) >= threshold:
-            anomaly_type = "High" if z_score > 0 else "Low"
-            message = (f"Anomaly Detected: Feature '{key}' in '{feature_name}' at {context} - "
-                       f"Count: {count}, Mean: {mean_val:.2f}, StdDev: {stdev_val:.2f}, "
-                       f"z-score: {z_score:.2f} ({anomaly_type} anomaly).")
-            logger.info(message)
+    # Compute every z-score in one vectorized pass and only visit the flagged entries
+    z_scores = (np.asarray(values, dtype=np.float64) - mean_val) / stdev_val
+    flagged = np.flatnonzero(np.abs(z_scores) >= threshold)
+    keys = list(distribution)
+    for index in flagged.tolist():
+        key, count, z_score = keys[index], values[index], float(z_scores[index])
+        anomaly_type = "High" if z_score > 0 else "Low"
+        message = (f"Anomaly Detected: Feature '{key}' in '{feature_name}' at {context} - "
+                   f"Count: {count}, Mean: {mean_val:.2f}, StdDev: {stdev_val:.2f}, "
+                   f"z-score: {z_score:.2f} ({anomaly_type} anomaly).")
+        logger.info(message)
 
 def analyze_anomaly_detection(analysis_results):
     '''
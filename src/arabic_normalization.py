@@ -1,5 +1,19 @@
 import re
 
+# Invisible Unicode artifacts (e.g., zero-width spaces) and Arabic diacritics (Tashkeel),
+# removed together in a single pass
+REMOVABLE_CHARACTERS_PATTERN = re.compile(r'[\u200b\u200c\u200d\ufeffًٌٍَُِّْٰ]+')
+
+# Mapping of various Arabic letters to standard forms (taa marbuta is handled separately)
+LETTER_NORMALIZATION_MAP = {
+    'أ': 'ا',
+    'إ': 'ا',
+    'آ': 'ا',
+    'ى': 'ي',
+    'ئ': 'ي',
+    'ؤ': 'و',
+}
+
 def normalize_text(text):
     '''
     Normalize the Arabic text by performing comprehensive normalization.
@@ -20,24 +34,14 @@ def normalize_text(text):
     :param text: The input Arabic text.
     :return: The normalized Arabic text.
     '''
-    # Remove invisible Unicode artifacts
-    text = re.sub(r'[\u200b\u200c\u200d\ufeff]', '', text)
-    
-    # Remove Arabic diacritics (Tashkeel)
-    text = re.sub(r'[ًٌٍَُِّْٰ]', '', text)
+    # Remove invisible Unicode artifacts and Arabic diacritics (Tashkeel)
+    text = REMOVABLE_CHARACTERS_PATTERN.sub('', text)
     
-    # Mapping of various Arabic letters to standard forms (taa marbuta is handled separately)
-    mapping = {
-        'أ': 'ا',
-        'إ': 'ا',
-        'آ': 'ا',
-        'ى': 'ي',
-        'ئ': 'ي',
-        'ؤ': 'و',
-    }
-    for original, replacement in mapping.items():
+    # Normalize various Arabic letters to standard forms (taa marbuta is handled separately)
+    for original, replacement in LETTER_NORMALIZATION_MAP.items():
         text = text.replace(original, replacement)
     
-    # Convert taa marbuta to ha only when it follows a ya (to transform tokens like "ىة" -> "يه")
-    text = re.sub(r'(?<=ي)ة', 'ه', text)
+    # Convert taa marbuta to ha only when it follows a ya (to transform tokens like "ىة" -> "يه").
+    # A plain substring replace is equivalent to the lookbehind (the pairs cannot overlap) and needs no regex.
+    text = text.replace('ية', 'يه')
     return text
\ No newline at end of file
@@ -50,7 +50,7 @@ def analyze_word_collocation(quran_data, window_size=3):
                 if j == i:
                     continue
                 neighbor = tokens[j]
-                pair = tuple(sorted([target, neighbor]))
+                pair = (target, neighbor) if target <= neighbor else (neighbor, target)
                 collocation_counter[pair] += 1
 
     logger.info("Word Collocation Analysis: Window size used: %d", window_size)
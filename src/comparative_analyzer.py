@@ -6,13 +6,13 @@ Makki and Madani Surahs. It leverages existing analysis modules and
 includes helper functions to compute approximate Dale-Chall and SMOG scores.
 """
 
+import heapq
 import logging
 import math
 import os
 from collections import Counter
 
-from src.data_loader import QuranDataLoader
-from src.text_preprocessor import TextPreprocessor
+from src.data_loader import load_preprocessed_verses
 from src.text_complexity_analyzer import calculate_flesch_reading_ease, calculate_flesch_kincaid_grade_level
 from src.frequency_analyzer import count_word_frequencies
 from src.gematria_analyzer import calculate_gematria_value
@@ -70,9 +70,10 @@ def compare_makki_madani_text_complexity(makki_surahs, madani_surahs):
     Compare text complexity metrics between Makki and Madani Surahs.
     
     For each metric (Flesch Reading Ease, Flesch-Kincaid Grade Level, Dale-Chall, SMOG Index),
-    this function loads the Quran data, filters verses by surah using the provided lists,
-    concatenates the preprocessed text, computes the metrics, logs the comparative results,
-    and returns a dictionary with metrics for 'Makki' and 'Madani' groups.
+    this function loads the preprocessed verses (shared with the other analyses via
+    load_preprocessed_verses), filters them by surah using the provided lists, concatenates their text,
+    computes the metrics, logs the comparative results, and returns a dictionary with metrics for
+    'Makki' and 'Madani' groups.
     
     :param makki_surahs: List of surah numbers (int) classified as Makki.
     :param madani_surahs: List of surah numbers (int) classified as Madani.
@@ -83,18 +84,16 @@ def compare_makki_madani_text_complexity(makki_surahs, madani_surahs):
     if not file_path:
         project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
         file_path = os.path.join(project_root, "data", "quran-uthmani-min.txt")
-    loader = QuranDataLoader(file_path=file_path)
-    data = loader.load_data()
-    processor = TextPreprocessor()
+    verses = load_preprocessed_verses(file_path)
+    makki_set = set(makki_surahs)
+    madani_set = set(madani_surahs)
     
     makki_texts = []
     madani_texts = []
-    for item in data:
-        surah = item.get("surah")
-        text = processor.preprocess_text(item.get("verse_text", ""))
-        if surah in makki_surahs:
+    for surah, _, text in verses:
+        if surah in makki_set:
             makki_texts.append(text)
-        elif surah in madani_surahs:
+        elif surah in madani_set:
             madani_texts.append(text)
     
     makki_text = "\n".join(makki_texts)
@@ -148,26 +147,28 @@ def compare_makki_madani_word_frequency_distribution(makki_surahs, madani_surahs
     :return: Dictionary with keys 'Makki' and 'Madani' mapping to lists of (word, frequency) tuples.
     """
     logger = logging.getLogger("quran_analysis")
-    loader = QuranDataLoader()
-    data = loader.load_data()
-    processor = TextPreprocessor()
+    file_path = os.getenv("DATA_FILE")
+    if not file_path:
+        project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        file_path = os.path.join(project_root, "data", "quran-uthmani-min.txt")
+    verses = load_preprocessed_verses(file_path)
+    makki_set = set(makki_surahs)
+    madani_set = set(madani_surahs)
     
     makki_tokens = []
     madani_tokens = []
-    for item in data:
-        surah = item.get("surah")
-        text = processor.preprocess_text(item.get("verse_text", ""))
+    for surah, _, text in verses:
         tokens = text.split()
-        if surah in makki_surahs:
+        if surah in makki_set:
             makki_tokens.extend(tokens)
-        elif surah in madani_surahs:
+        elif surah in madani_set:
             madani_tokens.extend(tokens)
     
     makki_freq = count_word_frequencies([makki_tokens])
     madani_freq = count_word_frequencies([madani_tokens])
     
-    top_makki = sorted(makki_freq.items(), key=lambda x: x[1], reverse=True)[:top_n]
-    top_madani = sorted(madani_freq.items(), key=lambda x: x[1], reverse=True)[:top_n]
+    top_makki = heapq.nlargest(top_n, makki_freq.items(), key=lambda x: x[1])
+    top_madani = heapq.nlargest(top_n, madani_freq.items(), key=lambda x: x[1])
     
     logger.info("Comparative Word Frequency Distribution Analysis:")
     logger.info("Makki Top %d Words: %s", top_n, top_makki)
@@ -191,22 +192,24 @@ def compare_makki_madani_gematria_distribution(makki_surahs, madani_surahs, top_
     :return: Dictionary with keys 'Makki' and 'Madani' mapping to lists of (gematria value, frequency) tuples.
     """
     logger = logging.getLogger("quran_analysis")
-    loader = QuranDataLoader()
-    data = loader.load_data()
-    processor = TextPreprocessor()
+    file_path = os.getenv("DATA_FILE")
+    if not file_path:
+        project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        file_path = os.path.join(project_root, "data", "quran-uthmani-min.txt")
+    verses = load_preprocessed_verses(file_path)
+    makki_set = set(makki_surahs)
+    madani_set = set(madani_surahs)
     
     makki_values = []
     madani_values = []
     
-    for item in data:
-        surah = item.get("surah")
-        text = processor.preprocess_text(item.get("verse_text", ""))
+    for surah, _, text in verses:
         tokens = text.split()
-        if surah in makki_surahs:
+        if surah in makki_set:
             for token in tokens:
                 value = calculate_gematria_value(token)
                 makki_values.append(value)
-        elif surah in madani_surahs:
+        elif surah in madani_set:
             for token in tokens:
                 value = calculate_gematria_value(token)
                 madani_values.append(value)
@@ -214,8 +217,8 @@ def compare_makki_madani_gematria_distribution(makki_surahs, madani_surahs, top_
     makki_distribution = Counter(makki_values)
     madani_distribution = Counter(madani_values)
     
-    top_makki = sorted(makki_distribution.items(), key=lambda x: x[1], reverse=True)[:top_n]
-    top_madani = sorted(madani_distribution.items(), key=lambda x: x[1], reverse=True)[:top_n]
+    top_makki = makki_distribution.most_common(top_n)
+    top_madani = madani_distribution.most_common(top_n)
     
     logger.info("Comparative Gematria Distribution Analysis:")
     logger.info("Makki Top %d Gematria Values: %s", top_n, top_makki)
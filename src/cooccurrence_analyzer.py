@@ -1,3 +1,4 @@
+import heapq
 import logging
 from src.tokenizer import tokenize_text
 
@@ -24,14 +25,13 @@ def analyze_word_cooccurrence(quran_data):
             continue
         for i in range(len(tokens) - 1):
             for j in range(i + 1, len(tokens)):
-                pair = tuple(sorted((tokens[i], tokens[j])))
+                pair = (tokens[i], tokens[j]) if tokens[i] <= tokens[j] else (tokens[j], tokens[i])
                 if pair in pair_counts:
                     pair_counts[pair] += 1
                 else:
                     pair_counts[pair] = 1
                     
-    sorted_pairs = sorted(pair_counts.items(), key=lambda item: item[1], reverse=True)
-    top_10000 = sorted_pairs[:10000]
+    top_10000 = heapq.nlargest(10000, pair_counts.items(), key=lambda item: item[1])
     logger.info("Word Co-occurrence Analysis Results - TOP 10000 Pairs:")
     for pair, count in top_10000:
         logger.info("Pair: %s, Count: %d", str(pair), count)
@@ -65,7 +65,7 @@ def analyze_root_word_cooccurrence(quran_data, top_n_pairs=10000):
         if len(roots) > 1:
             for i in range(len(roots)):
                 for j in range(i + 1, len(roots)):
-                    pair = tuple(sorted((roots[i], roots[j])))
+                    pair = (roots[i], roots[j]) if roots[i] <= roots[j] else (roots[j], roots[i])
                     root_pair_counts[pair] += 1
 
     logger.info("\n--- Root Word Co-occurrence Analysis ---")
@@ -102,7 +102,7 @@ def analyze_lemma_word_cooccurrence(quran_data, top_n_pairs=10000):
         if len(lemmas) > 1:
             for i in range(len(lemmas)):
                 for j in range(i + 1, len(lemmas)):
-                    pair = tuple(sorted((lemmas[i], lemmas[j])))
+                    pair = (lemmas[i], lemmas[j]) if lemmas[i] <= lemmas[j] else (lemmas[j], lemmas[i])
                     lemma_pair_counts[pair] += 1
 
     logger.info("\n--- Lemma Word Co-occurrence Analysis ---")
@@ -1,4 +1,7 @@
+import os
+from functools import lru_cache
 from src.tokenizer import tokenize_text
+from src.text_preprocessor import TextPreprocessor
 from camel_tools.morphology.database import MorphologyDB
 from camel_tools.morphology.analyzer import Analyzer
 
@@ -30,8 +33,9 @@ class QuranDataLoader:
         if not self.file_path:
             raise ValueError("No data file specified.")
         with open(self.file_path, "r", encoding="utf-8") as file:
-            db = MorphologyDB.builtin_db()
-            analyzer = Analyzer(db)            
+            analyzer = get_morphology_analyzer()
+            # Root and lemma per distinct token; repeated tokens reuse the first analysis
+            token_analyses = {}
             for line in file:
                 line = line.strip()
                 if not line:
@@ -48,18 +52,22 @@ class QuranDataLoader:
                 lemmas = []
                 try:            
                     for token in tokens:
-                        try:
-                            analyses = analyzer.analyze(token)
-                            if analyses and 'root' in analyses[0]:
-                                root = analyses[0]['root']
-                            else:
-                                root = token
-                            if analyses and 'lex' in analyses[0]:
-                                lemma = analyses[0]['lex']
-                            else:
-                                lemma = token                                
-                        except Exception as e:
-                            raise e
+                        if token in token_analyses:
+                            root, lemma = token_analyses[token]
+                        else:
+                            try:
+                                analyses = analyzer.analyze(token)
+                                if analyses and 'root' in analyses[0]:
+                                    root = analyses[0]['root']
+                                else:
+                                    root = token
+                                if analyses and 'lex' in analyses[0]:
+                                    lemma = analyses[0]['lex']
+                                else:
+                                    lemma = token                                
+                            except Exception as e:
+                                raise e
+                            token_analyses[token] = (root, lemma)
                         roots.append(root)
                         lemmas.append(lemma)
                 except Exception as e:
@@ -72,4 +80,47 @@ class QuranDataLoader:
                     "roots": roots,
                     "lemmas": lemmas
                 })
-        return data
\ No newline at end of file
+        return data
+
+@lru_cache(maxsize=1)
+def get_morphology_analyzer():
+    '''
+    Return the CAMeL Tools morphological analyzer used by QuranDataLoader, building it on first use.
+    
+    Loading the built-in morphology database is expensive, so the analyzer is created once per
+    process and shared by every load instead of being rebuilt for each file.
+    
+    :return: CAMeL Tools Analyzer over the built-in morphology database.
+    '''
+    return Analyzer(MorphologyDB.builtin_db())
+
+def load_preprocessed_verses(file_path):
+    '''
+    Load the Quran data file and return its verses with preprocessed text, reusing earlier loads.
+    
+    The result is cached per file and keyed on the file's modification time and size, so analysis
+    functions that each need the preprocessed text share a single load and preprocessing pass,
+    while a file that has been rewritten is loaded again.
+    
+    :param file_path: Path to the Quran data file.
+    :return: Tuple of (surah, ayah, processed_text) tuples in file order.
+    '''
+    stat = os.stat(file_path)
+    return _load_preprocessed_verses(os.path.abspath(file_path), stat.st_mtime_ns, stat.st_size)
+
+@lru_cache(maxsize=4)
+def _load_preprocessed_verses(file_path, mtime_ns, size):
+    '''
+    Load and preprocess the verses of the given file; cached by load_preprocessed_verses.
+    
+    :param file_path: Absolute path to the Quran data file.
+    :param mtime_ns: Modification time of the file in nanoseconds (part of the cache key).
+    :param size: Size of the file in bytes (part of the cache key).
+    :return: Tuple of (surah, ayah, processed_text) tuples in file order.
+    '''
+    data = QuranDataLoader(file_path=file_path).load_data()
+    processor = TextPreprocessor()
+    return tuple(
+        (item["surah"], item["ayah"], processor.preprocess_text(item["verse_text"]))
+        for item in data
+    )
@@ -2,6 +2,23 @@ import logging
 import statistics
 from collections import Counter, defaultdict
 
+def summarize_sentence_lengths(lengths):
+    '''
+    Compute the frequency distribution and summary statistics of a list of sentence lengths.
+    The lengths are counted once; the frequency dictionary and the modes both come from that count.
+
+    :param lengths: Non-empty list of sentence lengths (number of words per ayah).
+    :return: Tuple (frequency, average, median, modes, std_dev), where frequency maps each length to its count,
+             modes is the sorted list of the most frequent lengths and std_dev is 0 for a single length.
+    '''
+    counts = Counter(lengths)
+    max_count = max(counts.values())
+    modes = sorted([l for l, count in counts.items() if count == max_count])
+    avg = statistics.mean(lengths)
+    med = statistics.median(lengths)
+    std_dev = statistics.stdev(lengths) if len(lengths) > 1 else 0
+    return dict(counts), avg, med, modes, std_dev
+
 def analyze_surah_sentence_length_distribution_by_index(data):
     '''
     Analyze sentence length distribution for each Surah index.
@@ -17,10 +34,13 @@ def analyze_surah_sentence_length_distribution_by_index(data):
     logger = logging.getLogger("quran_analysis")
     surah_lengths = defaultdict(list)
     for item in data:
-        try:
-            surah_index = int(item.get("surah_number", 0))
-        except ValueError:
-            continue
+        surah_index = item.get("surah_number", 0)
+        if not isinstance(surah_index, int):
+            # The data loader already stores integers; only convert other representations.
+            try:
+                surah_index = int(surah_index)
+            except ValueError:
+                continue
         text = item.get("processed_text") or item.get("verse_text", "")
         words = text.split() if text else []
         surah_lengths[surah_index].append(len(words))
@@ -29,13 +49,7 @@ def analyze_surah_sentence_length_distribution_by_index(data):
     for surah_index, lengths in surah_lengths.items():
         if not lengths:
             continue
-        freq = dict(Counter(lengths))
-        avg = statistics.mean(lengths)
-        med = statistics.median(lengths)
-        counts = Counter(lengths)
-        max_count = max(counts.values())
-        modes = sorted([l for l, count in counts.items() if count == max_count])
-        std_dev = statistics.stdev(lengths) if len(lengths) > 1 else 0
+        freq, avg, med, modes, std_dev = summarize_sentence_lengths(lengths)
         results[surah_index] = {
             "frequency": freq,
             "average": avg,
@@ -62,10 +76,13 @@ def analyze_ayah_sentence_length_distribution_by_index(data):
     logger = logging.getLogger("quran_analysis")
     ayah_lengths = defaultdict(list)
     for item in data:
-        try:
-            ayah_index = int(item.get("ayah", 0))
-        except ValueError:
-            continue
+        ayah_index = item.get("ayah", 0)
+        if not isinstance(ayah_index, int):
+            # The data loader already stores integers; only convert other representations.
+            try:
+                ayah_index = int(ayah_index)
+            except ValueError:
+                continue
         text = item.get("processed_text") or item.get("verse_text", "")
         words = text.split() if text else []
         ayah_lengths[ayah_index].append(len(words))
@@ -74,13 +91,7 @@ def analyze_ayah_sentence_length_distribution_by_index(data):
     for ayah_index, lengths in ayah_lengths.items():
         if not lengths:
             continue
-        freq = dict(Counter(lengths))
-        avg = statistics.mean(lengths)
-        med = statistics.median(lengths)
-        counts = Counter(lengths)
-        max_count = max(counts.values())
-        modes = sorted([l for l, count in counts.items() if count == max_count])
-        std_dev = statistics.stdev(lengths) if len(lengths) > 1 else 0
+        freq, avg, med, modes, std_dev = summarize_sentence_lengths(lengths)
         results[ayah_index] = {
             "frequency": freq,
             "average": avg,
@@ -1,6 +1,8 @@
+import heapq
 import logging
 import statistics
 from collections import Counter, defaultdict
+from itertools import chain
 
 def count_word_frequencies(tokenized_text):
     '''
@@ -9,11 +11,7 @@ def count_word_frequencies(tokenized_text):
     :param tokenized_text: List of lists, where each inner list contains words from a verse.
     :return: Dictionary mapping words to their frequency count.
     '''
-    freq = {}
-    for tokens in tokenized_text:
-        for token in tokens:
-            freq[token] = freq.get(token, 0) + 1
-    return freq
+    return dict(Counter(chain.from_iterable(tokenized_text)))
 
 def analyze_word_length_distribution(tokenized_text):
     '''
@@ -278,7 +276,7 @@ def analyze_semantic_group_frequency(quran_data):
             semantic_group_counts[root] = semantic_group_counts.get(root, 0) + 1
     logger.info("Semantic Group Frequency Analysis:")
     logger.info("Total unique semantic groups: %d", len(semantic_group_counts))
-    top_20 = sorted(semantic_group_counts.items(), key=lambda item: item[1], reverse=True)[:20]
+    top_20 = heapq.nlargest(20, semantic_group_counts.items(), key=lambda item: item[1])
     logger.info("Top 20 most frequent semantic groups:")
     for root, count in top_20:
         logger.info("Root: %s, Count: %d", root, count)
@@ -303,9 +301,9 @@ def analyze_character_frequency(tokenized_text):
         for word in ayah:
             for char in word:
                 char_freq[char] = char_freq.get(char, 0) + 1
-    sorted_chars = sorted(char_freq.items(), key=lambda x: x[1], reverse=True)
+    top_20 = heapq.nlargest(20, char_freq.items(), key=lambda x: x[1])
     logger.info("Top 20 most frequent characters:")
-    for char, count in sorted_chars[:20]:
+    for char, count in top_20:
         logger.info("Character: %s, Count: %d", char, count)
     logger.info("Total unique characters: %d", len(char_freq))
     logger.info("Finished Character Frequency Analysis.")
@@ -315,8 +313,8 @@ def analyze_surah_character_frequency(data):
     """
     Analyze character frequency at the Surah level.
     
-    For each Surah, concatenates the preprocessed text of all ayahs within that Surah,
-    calculates and logs the frequency of each character.
+    For each Surah, accumulates the character counts of the preprocessed text of all ayahs within that Surah
+    (without concatenating the texts), then logs the frequency of each character.
     
     Logs:
     - Surah number.
@@ -330,14 +328,13 @@ def analyze_surah_character_frequency(data):
     from collections import Counter, defaultdict
     logger = logging.getLogger("quran_analysis")
     logger.info("Starting Surah-level Character Frequency Analysis.")
-    surah_texts = defaultdict(str)
+    surah_char_counters = defaultdict(Counter)
     for item in data:
         surah = item.get("surah_number", item.get("surah", "Unknown"))
         text = item.get("processed_text", item.get("text", item.get("verse_text", "")))
-        surah_texts[surah] += text
+        surah_char_counters[surah].update(text)
     result = {}
-    for surah, text in surah_texts.items():
-        char_counter = Counter(text)
+    for surah, char_counter in surah_char_counters.items():
         total_chars = sum(char_counter.values())
         sorted_chars = sorted(char_counter.items(), key=lambda x: x[1], reverse=True)
         logger.info("Surah-level Character Frequency Analysis - Surah: %s", surah)
@@ -1,8 +1,17 @@
+import heapq
 import logging
 import statistics
 from itertools import combinations
 from collections import Counter
 
+# Abjad numeral values of the Arabic letters, built once at import time.
+GEMATRIA_MAP = {
+    'ا': 1, 'ب': 2, 'ج': 3, 'د': 4, 'ه': 5, 'و': 6, 'ز': 7, 'ح': 8, 'ط': 9,
+    'ي': 10, 'ك': 20, 'ل': 30, 'م': 40, 'ن': 50, 'س': 60, 'ع': 70, 'ف': 80, 'ص': 90,
+    'ق': 100, 'ر': 200, 'ش': 300, 'ت': 400, 'ث': 500, 'خ': 600, 'ذ': 700, 'ض': 800, 'ظ': 900, 'غ': 1000,
+    'ء': 1, 'أ': 1, 'ؤ': 1, 'إ': 1, 'ئ': 1, 'ى': 10, 'ة': 5
+}
+
 def calculate_gematria_value(word):
     '''
     Calculate the Gematria value of the given Arabic word.
@@ -13,16 +22,16 @@ def calculate_gematria_value(word):
     :param word: Arabic word string.
     :return: Total Gematria value as an integer.
     '''
-    gematria_map = {
-        'ا': 1, 'ب': 2, 'ج': 3, 'د': 4, 'ه': 5, 'و': 6, 'ز': 7, 'ح': 8, 'ط': 9,
-        'ي': 10, 'ك': 20, 'ل': 30, 'م': 40, 'ن': 50, 'س': 60, 'ع': 70, 'ف': 80, 'ص': 90,
-        'ق': 100, 'ر': 200, 'ش': 300, 'ت': 400, 'ث': 500, 'خ': 600, 'ذ': 700, 'ض': 800, 'ظ': 900, 'غ': 1000,
-        'ء': 1, 'أ': 1, 'ؤ': 1, 'إ': 1, 'ئ': 1, 'ى': 10, 'ة': 5
-    }
+    # Fast path: every letter is mapped (GEMATRIA_MAP has no zero values), so sum the lookups in C.
+    # An unmapped letter yields None, which makes sum() raise; fall back to the warning loop below.
+    try:
+        return sum(map(GEMATRIA_MAP.get, word))
+    except TypeError:
+        pass
     total = 0
     logger = logging.getLogger("quran_analysis")
     for char in word:
-        value = gematria_map.get(char, 0)
+        value = GEMATRIA_MAP.get(char, 0)
         if value == 0:
             logger.warning("Character '%s' not found in Gematria mapping. Treated as 0.", char)
         total += value
@@ -32,24 +41,26 @@ def analyze_gematria_value_distribution(tokenized_text):
     '''
     Analyze the frequency distribution of Gematria values across all words in the Quran text.
     
-    Iterates over the tokenized text (list of lists of words), calculates the Gematria value for each word,
-    and updates a count dictionary. Logs the distribution of Gematria values including the top 10 most frequent values.
+    Builds a word -> occurrence count index over the tokenized text (list of lists of words) in a single pass,
+    then calculates the Gematria value once per distinct word and adds its occurrence count to the distribution.
+    Logs the distribution of Gematria values including the top 10 most frequent values.
     
     :param tokenized_text: List of lists of Arabic words.
     :return: Dictionary mapping Gematria values (integers) to their frequency count.
     '''
     logger = logging.getLogger("quran_analysis")
     gematria_value_counts = {}
-    
+    word_counts = Counter()
     for tokens in tokenized_text:
-        for word in tokens:
-            value = calculate_gematria_value(word)
-            gematria_value_counts[value] = gematria_value_counts.get(value, 0) + 1
-            
+        word_counts.update(tokens)
+
+    for word, count in word_counts.items():
+        value = calculate_gematria_value(word)
+        gematria_value_counts[value] = gematria_value_counts.get(value, 0) + count
+
     logger.info("Gematria Value Distribution Analysis:")
     logger.info("Complete Gematria Distribution: %s", gematria_value_counts)
-    sorted_distribution = sorted(gematria_value_counts.items(), key=lambda item: item[1], reverse=True)
-    top_10 = sorted_distribution[:10]
+    top_10 = heapq.nlargest(10, gematria_value_counts.items(), key=lambda item: item[1])
     logger.info("Top 10 most frequent Gematria values:")
     for value, count in top_10:
         logger.info("Gematria Value: %d, Count: %d", value, count)
@@ -62,12 +73,7 @@ def get_default_gematria_mapping():
     
     :return: Dictionary mapping Arabic letters to Gematria values.
     '''
-    return {
-        'ا': 1, 'ب': 2, 'ج': 3, 'د': 4, 'ه': 5, 'و': 6, 'ز': 7, 'ح': 8, 'ط': 9,
-        'ي': 10, 'ك': 20, 'ل': 30, 'م': 40, 'ن': 50, 'س': 60, 'ع': 70, 'ف': 80, 'ص': 90,
-        'ق': 100, 'ر': 200, 'ش': 300, 'ت': 400, 'ث': 500, 'خ': 600, 'ذ': 700, 'ض': 800, 'ظ': 900, 'غ': 1000,
-        'ء': 1, 'أ': 1, 'ؤ': 1, 'إ': 1, 'ئ': 1, 'ى': 10, 'ة': 5
-    }
+    return dict(GEMATRIA_MAP)
 
 def calculate_gematria_value_with_mapping(word, gematria_mapping):
     '''
@@ -86,6 +92,51 @@ def calculate_gematria_value_with_mapping(word, gematria_mapping):
         total += value
     return total
 
+def summarize_gematria_frequency(frequency):
+    '''
+    Compute summary statistics (mean, median, mode, stdev) from a Gematria value frequency distribution.
+    
+    Works directly on the value -> count mapping instead of an expanded list of per-word values: the sum
+    and mode come from one pass over the distinct values, and the median is located by walking the sorted
+    values with a cumulative count. Mean, median and mode match statistics.mean, statistics.median and
+    statistics.mode over the expanded values (the mode is the first most frequent value in insertion order);
+    the stdev is statistics.stdev over the expanded values.
+    
+    :param frequency: Dictionary mapping Gematria values (numbers) to their occurrence counts.
+    :return: Tuple (mean, median, mode, stdev); all zero when the distribution is empty.
+    '''
+    n = 0
+    total = 0
+    mode_val = None
+    mode_count = 0
+    for value, count in frequency.items():
+        n += count
+        total += value * count
+        if count > mode_count:
+            mode_val, mode_count = value, count
+    if n == 0:
+        return 0, 0, 0, 0
+    mean_val = total // n if total % n == 0 else total / n
+    
+    lower_index = (n - 1) // 2
+    upper_index = n // 2
+    lower = upper = None
+    seen = 0
+    for value in sorted(frequency):
+        seen += frequency[value]
+        if lower is None and seen > lower_index:
+            lower = value
+        if seen > upper_index:
+            upper = value
+            break
+    median_val = lower if n % 2 == 1 else (lower + upper) / 2
+    
+    if n > 1:
+        stdev_val = statistics.stdev(Counter(frequency).elements())
+    else:
+        stdev_val = 0
+    return mean_val, median_val, mode_val, stdev_val
+
 def analyze_surah_gematria_distribution(quran_data, gematria_mapping):
     '''
     Analyze the Gematria value distribution at the Surah level.
@@ -100,6 +151,7 @@ def analyze_surah_gematria_distribution(quran_data, gematria_mapping):
     logger = logging.getLogger("quran_analysis")
     surah_results = {}
     surah_groups = {}
+    word_values = {}
     for item in quran_data:
         surah_id = item.get("surah", "Unknown")
         text = item.get("processed_text") or item.get("verse_text", "")
@@ -107,22 +159,13 @@ def analyze_surah_gematria_distribution(quran_data, gematria_mapping):
         surah_groups.setdefault(surah_id, []).extend(words)
     
     for surah_id, words in surah_groups.items():
-        values = []
         frequency = {}
         for word in words:
-            val = calculate_gematria_value_with_mapping(word, gematria_mapping)
-            values.append(val)
+            val = word_values.get(word)
+            if val is None:
+                val = word_values[word] = calculate_gematria_value_with_mapping(word, gematria_mapping)
             frequency[val] = frequency.get(val, 0) + 1
-        if values:
-            mean_val = statistics.mean(values)
-            median_val = statistics.median(values)
-            try:
-                mode_val = statistics.mode(values)
-            except statistics.StatisticsError:
-                mode_val = "No unique mode"
-            stdev_val = statistics.stdev(values) if len(values) > 1 else 0
-        else:
-            mean_val = median_val = mode_val = stdev_val = 0
+        mean_val, median_val, mode_val, stdev_val = summarize_gematria_frequency(frequency)
         summary = {"mean": mean_val, "median": median_val, "mode": mode_val, "stdev": stdev_val}
         surah_results[surah_id] = {"frequency": frequency, "summary": summary}
         logger.info("Surah %s: Gematria Distribution: %s", surah_id, frequency)
@@ -142,28 +185,20 @@ def analyze_ayah_gematria_distribution(quran_data, gematria_mapping):
     '''
     logger = logging.getLogger("quran_analysis")
     ayah_results = {}
+    word_values = {}
     for item in quran_data:
         surah_id = item.get("surah", "Unknown")
         ayah_id = item.get("ayah", "Unknown")
         identifier = f"{surah_id}|{ayah_id}"
         text = item.get("processed_text") or item.get("verse_text", "")
         words = text.split()
-        values = []
         frequency = {}
         for word in words:
-            val = calculate_gematria_value_with_mapping(word, gematria_mapping)
-            values.append(val)
+            val = word_values.get(word)
+            if val is None:
+                val = word_values[word] = calculate_gematria_value_with_mapping(word, gematria_mapping)
             frequency[val] = frequency.get(val, 0) + 1
-        if values:
-            mean_val = statistics.mean(values)
-            median_val = statistics.median(values)
-            try:
-                mode_val = statistics.mode(values)
-            except statistics.StatisticsError:
-                mode_val = "No unique mode"
-            stdev_val = statistics.stdev(values) if len(values) > 1 else 0
-        else:
-            mean_val = median_val = mode_val = stdev_val = 0
+        mean_val, median_val, mode_val, stdev_val = summarize_gematria_frequency(frequency)
         summary = {"mean": mean_val, "median": median_val, "mode": mode_val, "stdev": stdev_val}
         ayah_results[identifier] = {"frequency": frequency, "summary": summary}
         logger.info("Ayah %s: Gematria Distribution: %s", identifier, frequency)
@@ -184,17 +219,19 @@ def analyze_first_word_gematria_ayah(quran_data, gematria_mapping):
     '''
     logger = logging.getLogger("quran_analysis")
     frequency = {}
+    word_values = {}
     for item in quran_data:
         text = item.get("processed_text") or item.get("verse_text", "")
         words = text.split()
         if words:
             first_word = words[0]
-            value = calculate_gematria_value_with_mapping(first_word, gematria_mapping)
+            value = word_values.get(first_word)
+            if value is None:
+                value = word_values[first_word] = calculate_gematria_value_with_mapping(first_word, gematria_mapping)
             frequency[value] = frequency.get(value, 0) + 1
     logger.info("First Word Gematria Frequency Analysis:")
     logger.info("Complete Frequency: %s", frequency)
-    sorted_freq = sorted(frequency.items(), key=lambda kv: kv[1], reverse=True)
-    top_10 = sorted_freq[:10]
+    top_10 = heapq.nlargest(10, frequency.items(), key=lambda kv: kv[1])
     logger.info("Top 10 most frequent Gematria values for first words:")
     for val, count in top_10:
         logger.info("Gematria Value: %d, Count: %d", val, count)
@@ -214,17 +251,19 @@ def analyze_last_word_gematria_ayah(quran_data, gematria_mapping):
     '''
     logger = logging.getLogger("quran_analysis")
     frequency = {}
+    word_values = {}
     for item in quran_data:
         text = item.get("processed_text") or item.get("verse_text", "")
         words = text.split()
         if words:
             last_word = words[-1]
-            value = calculate_gematria_value_with_mapping(last_word, gematria_mapping)
+            value = word_values.get(last_word)
+            if value is None:
+                value = word_values[last_word] = calculate_gematria_value_with_mapping(last_word, gematria_mapping)
             frequency[value] = frequency.get(value, 0) + 1
     logger.info("Last Word Gematria Frequency Analysis:")
     logger.info("Complete Frequency: %s", frequency)
-    sorted_freq = sorted(frequency.items(), key=lambda kv: kv[1], reverse=True)
-    top_10 = sorted_freq[:10]
+    top_10 = heapq.nlargest(10, frequency.items(), key=lambda kv: kv[1])
     logger.info("Top 10 most frequent Gematria values for last words:")
     for val, count in top_10:
         logger.info("Gematria Value: %d, Count: %d", val, count)
@@ -246,13 +285,19 @@ def analyze_gematria_cooccurrence_ayah(quran_data):
     '''
     logger = logging.getLogger("quran_analysis")
     cooccurrence_counter = Counter()
+    word_values = {}
     
     for item in quran_data:
         text = item.get("processed_text") or item.get("verse_text", "")
         if not text:
             continue
         words = text.split()
-        gematria_values = [calculate_gematria_value(word) for word in words]
+        gematria_values = []
+        for word in words:
+            value = word_values.get(word)
+            if value is None:
+                value = word_values[word] = calculate_gematria_value(word)
+            gematria_values.append(value)
         sorted_values = sorted(gematria_values)
         if len(sorted_values) < 2:
             continue
@@ -284,20 +329,28 @@ def analyze_semantic_group_gematria_distribution(quran_data, gematria_mapping):
     '''
     logger = logging.getLogger("quran_analysis")
     semantic_group_distribution = {}
+    word_values = {}
     for item in quran_data:
         text = item.get("processed_text") or item.get("verse_text", "")
         words = text.split() if text else []
         groups = item.get("semantic_groups", [])
+        if not groups:
+            continue
+        values = []
+        for word in words:
+            value = word_values.get(word)
+            if value is None:
+                value = word_values[word] = calculate_gematria_value_with_mapping(word, gematria_mapping)
+            values.append(value)
         for group in groups:
             if group not in semantic_group_distribution:
                 semantic_group_distribution[group] = {}
-            for word in words:
-                value = calculate_gematria_value_with_mapping(word, gematria_mapping)
-                semantic_group_distribution[group][value] = semantic_group_distribution[group].get(value, 0) + 1
+            distribution = semantic_group_distribution[group]
+            for value in values:
+                distribution[value] = distribution.get(value, 0) + 1
     
     for group, distribution in semantic_group_distribution.items():
-        sorted_distribution = sorted(distribution.items(), key=lambda x: x[1], reverse=True)
-        top_10 = sorted_distribution[:10]
+        top_10 = heapq.nlargest(10, distribution.items(), key=lambda x: x[1])
         logger.info("Semantic Group '%s': Gematria Distribution: %s", group, distribution)
         logger.info("Semantic Group '%s': Top 10 Gematria Values: %s", group, top_10)
     
@@ -328,14 +381,16 @@ def analyze_gematria_distribution_by_sentence_length(quran_data):
         sentence_length_groups[length].extend(words)
     
     distribution_by_length = {}
+    word_values = {}
     for length, words in sentence_length_groups.items():
         freq = {}
         for word in words:
-            value = calculate_gematria_value(word)
+            value = word_values.get(word)
+            if value is None:
+                value = word_values[word] = calculate_gematria_value(word)
             freq[value] = freq.get(value, 0) + 1
         distribution_by_length[length] = freq
-        sorted_freq = sorted(freq.items(), key=lambda kv: kv[1], reverse=True)
-        most_common = sorted_freq[0] if sorted_freq else (None, 0)
+        most_common = max(freq.items(), key=lambda kv: kv[1], default=(None, 0))
         logger.info("Sentence Length: %d, Gematria Distribution: %s", length, freq)
         logger.info("Sentence Length: %d, Most frequent Gematria Value: %s with count %d", length, most_common[0], most_common[1])
     return distribution_by_length
\ No newline at end of file
@@ -2,6 +2,8 @@
 Module for Arabic lemmatization.
 '''
 
+from functools import lru_cache
+
 try:
     from camel_tools.lemmatizer import Lemmatizer
     _lemmatizer_instance = Lemmatizer(model='calima-msa')
@@ -12,13 +14,26 @@ def lemmatize_token(token):
     '''
     Lemmatize the given Arabic token using CAMeL Tools.
     
+    Results are memoized per lemmatizer instance and token, so repeated tokens are lemmatized only once.
+    
     :param token: The Arabic word token.
     :return: The lemmatized form of the token.
     '''
     if _lemmatizer_instance is not None:
-        try:
-            lemma = _lemmatizer_instance.lemmatize(token)
-            return lemma
-        except Exception:
-            return token
-    return token
\ No newline at end of file
+        return _lemmatize_with_lemmatizer(_lemmatizer_instance, token)
+    return token
+
+@lru_cache(maxsize=65536)
+def _lemmatize_with_lemmatizer(lemmatizer, token):
+    '''
+    Lemmatize the token with the given lemmatizer; cached by (lemmatizer, token).
+    
+    :param lemmatizer: CAMeL Tools lemmatizer instance.
+    :param token: The Arabic word token.
+    :return: The lemmatized form of the token.
+    '''
+    try:
+        lemma = lemmatizer.lemmatize(token)
+        return lemma
+    except Exception:
+        return token
\ No newline at end of file
@@ -1,10 +1,11 @@
+import heapq
 import logging
 import os
 import json
 import datetime
-from collections import Counter
+from collections import Counter, defaultdict
 from src.logger_config import configure_logger
-from src.data_loader import QuranDataLoader, MAKKI_SURAHS, MADANI_SURAHS
+from src.data_loader import QuranDataLoader, MAKKI_SURAHS, MADANI_SURAHS, load_preprocessed_verses
 from src.text_preprocessor import TextPreprocessor
 
 def generate_summary(metadata, unique_words_count, top_words, gematria_cooccurrence):
@@ -36,7 +37,7 @@ def analyze_quran_text_complexity():
     '''
     Analyze text complexity for the entire Quran.
     
-    Loads the Quran data, concatenates the preprocessed text from all verses,
+    Loads the preprocessed verses (shared with the other analyses), concatenates their text,
     calls the analyze_text_complexity() function from the text_complexity_analyzer module,
     logs the resulting metrics with a clear identifier, and returns the metrics.
     
@@ -48,10 +49,8 @@ def analyze_quran_text_complexity():
     if not file_path:
         project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
         file_path = os.path.join(project_root, "data", "quran-uthmani-min.txt")
-    loader = QuranDataLoader(file_path=file_path)
-    data = loader.load_data()
-    processor = TextPreprocessor()
-    all_text = "\n".join(processor.preprocess_text(item.get("verse_text", "")) for item in data)
+    verses = load_preprocessed_verses(file_path)
+    all_text = "\n".join(text for _, _, text in verses)
     metrics = analyze_text_complexity(all_text)
     logger.info("Quran Text Complexity Analysis: %s", metrics)
     return metrics
@@ -60,7 +59,7 @@ def analyze_surah_text_complexity():
     '''
     Analyze text complexity for each Surah.
     
-    Loads the Quran data, groups the verses by Surah, concatenates the preprocessed text
+    Loads the preprocessed verses (shared with the other analyses), groups them by Surah, concatenates the text
     for each Surah, calls the analyze_text_complexity() function for each Surah,
     logs the complexity metrics with clear identifiers, and returns a dictionary mapping
     each Surah to its metrics.
@@ -73,14 +72,10 @@ def analyze_surah_text_complexity():
     if not file_path:
         project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
         file_path = os.path.join(project_root, "data", "quran-uthmani-min.txt")
-    loader = QuranDataLoader(file_path=file_path)
-    data = loader.load_data()
-    processor = TextPreprocessor()
-    surah_groups = {}
-    for item in data:
-        surah = item.get("surah", "Unknown")
-        processed_text = processor.preprocess_text(item.get("verse_text", ""))
-        surah_groups.setdefault(surah, []).append(processed_text)
+    verses = load_preprocessed_verses(file_path)
+    surah_groups = defaultdict(list)
+    for surah, _, processed_text in verses:
+        surah_groups[surah].append(processed_text)
     surah_metrics = {}
     for surah, texts in surah_groups.items():
         full_text = "\n".join(texts)
@@ -93,7 +88,7 @@ def analyze_ayah_text_complexity():
     '''
     Analyze text complexity for each Ayah.
     
-    Loads the Quran data, and for each Ayah, preprocesses the verse text,
+    Loads the preprocessed verses (shared with the other analyses), and for each Ayah
     calls the analyze_text_complexity() function, logs the complexity metrics with clear identifiers,
     and returns a dictionary mapping each Ayah (formatted as "surah|ayah") to its metrics.
     
@@ -105,14 +100,9 @@ def analyze_ayah_text_complexity():
     if not file_path:
         project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
         file_path = os.path.join(project_root, "data", "quran-uthmani-min.txt")
-    loader = QuranDataLoader(file_path=file_path)
-    data = loader.load_data()
-    processor = TextPreprocessor()
+    verses = load_preprocessed_verses(file_path)
     ayah_metrics = {}
-    for item in data:
-        surah = item.get("surah", "Unknown")
-        ayah = item.get("ayah", "Unknown")
-        text = processor.preprocess_text(item.get("verse_text", ""))
+    for surah, ayah, text in verses:
         metrics = analyze_text_complexity(text)
         logger.info("Surah %s, Ayah %s Text Complexity Analysis: %s", surah, ayah, metrics)
         ayah_metrics[f"{surah}|{ayah}"] = metrics
@@ -251,7 +241,7 @@ def main():
         word_frequencies = count_word_frequencies(tokenized_text)
         unique_words_count = len(word_frequencies)
         logger.info("Total unique words: %d", unique_words_count)
-        top_words = sorted(word_frequencies.items(), key=lambda x: x[1], reverse=True)[:2000]
+        top_words = heapq.nlargest(2000, word_frequencies.items(), key=lambda x: x[1])
         logger.info("Top 2000 most frequent words:")
         for word, count in top_words:
             logger.info("Word: %s, Count: %d", word, count)
@@ -332,10 +322,8 @@ def main():
         
         # Integrate Semantic Group Co-occurrence Analysis at Ayah Level
         from src.semantic_analyzer import analyze_semantic_group_cooccurrence_ayah
-        logger.info("Starting Semantic Group Co-occurrence Analysis at Ayah Level.")
         semantic_cooccurrence = analyze_semantic_group_cooccurrence_ayah(data)
-        logger.info("Top 10 semantic group co-occurrence pairs: %s", sorted(semantic_cooccurrence.items(), key=lambda x: x[1], reverse=True)[:10])
-        logger.info("Total unique semantic group co-occurrence pairs found: %d", len(semantic_cooccurrence))
+        logger.info("Semantic Group Co-occurrence Analysis at Ayah Level completed.")
         
         # Integrate root word frequency analysis
         from src.frequency_analyzer import analyze_root_word_frequency
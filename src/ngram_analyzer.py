@@ -1,6 +1,19 @@
 import logging
 from collections import Counter
 
+def iterate_word_ngrams(tokens, n):
+    '''
+    Generate the word n-grams of a token list using a sliding window.
+
+    The windows are built by zipping n staggered slices of the tokens, so the tuples
+    are produced in C without indexing the list once per n-gram.
+
+    :param tokens: List of tokens.
+    :param n: The size of the n-gram.
+    :return: Iterator over n-gram tuples in order (empty if there are fewer than n tokens).
+    '''
+    return zip(*(tokens[i:] for i in range(n)))
+
 def analyze_word_ngrams(quran_data, n=2):
     '''
     Analyze word n-gram frequency for the Quran data.
@@ -29,9 +42,7 @@ def analyze_word_ngrams(quran_data, n=2):
         if len(tokens) < n:
             continue
 
-        for i in range(len(tokens) - n + 1):
-            ngram = tuple(tokens[i:i+n])
-            ngram_counts[ngram] += 1
+        ngram_counts.update(iterate_word_ngrams(tokens, n))
 
     top_20 = ngram_counts.most_common(20)
     logger.info("Top 20 most frequent word bigrams:")
@@ -73,14 +84,11 @@ def analyze_surah_word_ngrams(data, n=2):
     
     for surah, info in surah_grouped.items():
         tokens = info["tokens"]
-        counter = Counter()
         if len(tokens) < n:
-            surah_ngram_counts[surah] = counter
+            surah_ngram_counts[surah] = Counter()
             logger.info("Surah %s (%s) has insufficient tokens for n-gram analysis.", surah, info["name"])
             continue
-        for i in range(len(tokens) - n + 1):
-            ngram = tuple(tokens[i:i+n])
-            counter[ngram] += 1
+        counter = Counter(iterate_word_ngrams(tokens, n))
         top_10 = counter.most_common(10)
         log_message = {
             "Surah": surah,
@@ -117,14 +125,11 @@ def analyze_ayah_word_ngrams(data, n=2):
         ayah_id = f"{surah}|{ayah}"
         text = item.get("processed_text") or item.get("verse_text", "")
         tokens = text.split() if text else []
-        counter = Counter()
         if len(tokens) < n:
-            ayah_ngram_counts[ayah_id] = counter
+            ayah_ngram_counts[ayah_id] = Counter()
             logger.info("Ayah %s has insufficient tokens for n-gram analysis.", ayah_id)
             continue
-        for i in range(len(tokens) - n + 1):
-            ngram = tuple(tokens[i:i+n])
-            counter[ngram] += 1
+        counter = Counter(iterate_word_ngrams(tokens, n))
         top_5 = counter.most_common(5)
         log_message = {
             "Ayah": ayah_id,
@@ -152,14 +157,11 @@ def analyze_character_ngrams(quran_data, n=2):
     from collections import Counter
     logger = logging.getLogger("quran_analysis")
     logger.info("Starting Character N-gram Analysis at Quran level.")
-    combined_text = ""
-    for item in quran_data:
-        text = item.get("processed_text") or item.get("text") or item.get("verse_text", "")
-        combined_text += text
-    ngram_counts = Counter()
-    for i in range(len(combined_text) - n + 1):
-        ngram = combined_text[i:i+n]
-        ngram_counts[ngram] += 1
+    combined_text = "".join(
+        item.get("processed_text") or item.get("text") or item.get("verse_text", "")
+        for item in quran_data
+    )
+    ngram_counts = Counter(combined_text[i:i+n] for i in range(len(combined_text) - n + 1))
     top_10 = ngram_counts.most_common(10)
     logger.info("Quran-wide Character N-gram Analysis - Top 10 n-grams: %s", top_10)
     logger.info("Total unique character n-grams: %d", len(ngram_counts))
@@ -182,17 +184,15 @@ def analyze_surah_character_ngrams(quran_data, n=2):
     from collections import defaultdict, Counter
     logger = logging.getLogger("quran_analysis")
     logger.info("Starting Character N-gram Analysis at Surah level.")
-    surah_texts = defaultdict(str)
+    surah_texts = defaultdict(list)
     for item in quran_data:
         surah = item.get("surah_number") or item.get("surah", "Unknown")
         text = item.get("processed_text") or item.get("text") or item.get("verse_text", "")
-        surah_texts[surah] += text
+        surah_texts[surah].append(text)
     surah_ngram_counts = {}
-    for surah, text in surah_texts.items():
-        counter = Counter()
-        for i in range(len(text) - n + 1):
-            ngram = text[i:i+n]
-            counter[ngram] += 1
+    for surah, texts in surah_texts.items():
+        text = "".join(texts)
+        counter = Counter(text[i:i+n] for i in range(len(text) - n + 1))
         top_10 = counter.most_common(10)
         logger.info("Surah-level Character N-gram Analysis - Surah: %s, Top 10 n-grams: %s", surah, top_10)
         logger.info("Surah %s - Total unique character n-grams: %d", surah, len(counter))
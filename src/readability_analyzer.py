@@ -20,8 +20,8 @@ Additionally, this module provides analysis functions that compute these metrics
 import os
 import math
 import logging
-from src.data_loader import QuranDataLoader
-from src.text_preprocessor import TextPreprocessor
+from collections import defaultdict
+from src.data_loader import load_preprocessed_verses
 
 def load_common_arabic_words():
     '''
@@ -41,7 +41,7 @@ def load_common_arabic_words():
         "في", "من", "على", "إلى", "و", "ما", "كان", "الله", "عن", "لا", "كل", "مع", "هذا", "ذلك", "هو", "هي"
     }
 
-COMMON_ARABIC_WORDS = load_common_arabic_words()
+COMMON_ARABIC_WORDS = frozenset(load_common_arabic_words())
 
 def split_sentences(text, delimiter="\n"):
     '''
@@ -63,6 +63,47 @@ def is_polysyllabic(word, threshold=4):
     '''
     return len(word) > threshold
 
+def count_dale_chall_features(texts):
+    '''
+    Count the words, difficult words and sentences used by the Dale-Chall formula.
+    
+    The texts are counted as if they were joined with newlines, so callers that hold the text
+    verse by verse get the counts for the whole collection without building one concatenated string.
+    Difficult words are those not in COMMON_ARABIC_WORDS.
+    
+    :param texts: Iterable of preprocessed Arabic text strings.
+    :return: Tuple (total_words, difficult_word_count, sentence_count).
+    '''
+    total_words = 0
+    difficult_word_count = 0
+    sentence_count = 0
+    for text in texts:
+        words = text.split()
+        total_words += len(words)
+        difficult_word_count += sum(1 for word in words if word not in COMMON_ARABIC_WORDS)
+        sentence_count += len(split_sentences(text))
+    return total_words, difficult_word_count, sentence_count
+
+def count_smog_features(texts, polysyllabic_threshold=4):
+    '''
+    Count the polysyllabic words and sentences used by the SMOG formula.
+    
+    The texts are counted as if they were joined with newlines. Words are classified with
+    is_polysyllabic using polysyllabic_threshold.
+    
+    :param texts: Iterable of preprocessed Arabic text strings.
+    :param polysyllabic_threshold: The character length above which a word is considered polysyllabic.
+    :return: Tuple (polysyllabic_word_count, sentence_count).
+    '''
+    polysyllabic_word_count = 0
+    sentence_count = 0
+    for text in texts:
+        polysyllabic_word_count += sum(
+            1 for word in text.split() if is_polysyllabic(word, polysyllabic_threshold)
+        )
+        sentence_count += len(split_sentences(text))
+    return polysyllabic_word_count, sentence_count
+
 def calculate_dale_chall_readability(text):
     '''
     Calculate the Dale-Chall Readability Score for the given preprocessed Arabic text.
@@ -77,16 +118,24 @@ def calculate_dale_chall_readability(text):
     :param text: Preprocessed Arabic text as a string.
     :return: The Dale-Chall Readability Score as a float.
     '''
-    words = text.split()
-    total_words = len(words)
+    total_words, difficult_word_count, sentence_count = count_dale_chall_features((text,))
+    return dale_chall_score_from_counts(total_words, difficult_word_count, sentence_count)
+
+def dale_chall_score_from_counts(total_words, difficult_word_count, sentence_count):
+    '''
+    Apply the Dale-Chall formula to precomputed word, difficult-word and sentence counts.
+    
+    :param total_words: Number of words.
+    :param difficult_word_count: Number of words not in the common Arabic word list.
+    :param sentence_count: Number of non-empty sentences (treated as 1 when zero).
+    :return: The Dale-Chall Readability Score as a float.
+    '''
     if total_words == 0:
         percentage_difficult = 0
     else:
-        difficult_word_count = sum(1 for word in words if word not in COMMON_ARABIC_WORDS)
         percentage_difficult = (difficult_word_count / total_words) * 100
 
-    sentences = split_sentences(text)
-    sentence_count = len(sentences) if sentences else 1
+    sentence_count = sentence_count or 1
     average_sentence_length = total_words / sentence_count if sentence_count > 0 else total_words
 
     score = 0.1579 * percentage_difficult + 0.0496 * average_sentence_length + 3.6365
@@ -105,11 +154,18 @@ def calculate_smog_index(text):
     :param text: Preprocessed Arabic text as a string.
     :return: The SMOG Index as a float.
     '''
-    words = text.split()
-    total_words = len(words)
-    polysyllabic_word_count = sum(1 for word in words if is_polysyllabic(word, threshold=4))
-    sentences = split_sentences(text)
-    sentence_count = len(sentences) if sentences else 1
+    polysyllabic_word_count, sentence_count = count_smog_features((text,), polysyllabic_threshold=4)
+    return smog_index_from_counts(polysyllabic_word_count, sentence_count)
+
+def smog_index_from_counts(polysyllabic_word_count, sentence_count):
+    '''
+    Apply the SMOG formula to precomputed polysyllabic-word and sentence counts.
+    
+    :param polysyllabic_word_count: Number of polysyllabic words.
+    :param sentence_count: Number of non-empty sentences (treated as 1 when zero).
+    :return: The SMOG Index as a float.
+    '''
+    sentence_count = sentence_count or 1
     smog_index = 1.0430 * ((polysyllabic_word_count * (30 / sentence_count)) ** 0.5) + 3.1291
     return smog_index
 
@@ -117,8 +173,9 @@ def analyze_quran_dale_chall_readability():
     '''
     Analyze the Dale-Chall Readability Score for the entire Quran text.
     
-    Loads the Quran data using QuranDataLoader, preprocesses the text using TextPreprocessor,
-    concatenates all verses into a single string, computes the Dale-Chall score, logs the result,
+    Loads the preprocessed Quran verses (shared across analyses via load_preprocessed_verses),
+    accumulates the readability counts verse by verse (treating each verse as a sentence, without
+    concatenating the whole text), computes the Dale-Chall score, logs the result,
     and returns the score.
     
     :return: The Dale-Chall Readability Score for the entire Quran as a float.
@@ -128,11 +185,11 @@ def analyze_quran_dale_chall_readability():
     if file_path is None:
         project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
         file_path = os.path.join(project_root, "data", "quran-uthmani-min.txt")
-    loader = QuranDataLoader(file_path=file_path)
-    data = loader.load_data()
-    processor = TextPreprocessor()
-    all_text = "\n".join(processor.preprocess_text(item.get("verse_text", "")) for item in data)
-    score = calculate_dale_chall_readability(all_text)
+    verses = load_preprocessed_verses(file_path)
+    total_words, difficult_word_count, sentence_count = count_dale_chall_features(
+        processed_text for _, _, processed_text in verses
+    )
+    score = dale_chall_score_from_counts(total_words, difficult_word_count, sentence_count)
     logger.info("Quran Dale-Chall Readability Score: %f", score)
     return score
 
@@ -140,7 +197,7 @@ def analyze_surah_dale_chall_readability():
     '''
     Analyze the Dale-Chall Readability Score for each Surah.
     
-    Loads the Quran data, groups the verses by Surah, concatenates the preprocessed text for each Surah,
+    Loads the preprocessed Quran verses, groups them by Surah, concatenates the text for each Surah,
     computes the Dale-Chall score for each group, logs the results, and returns a dictionary mapping
     each Surah to its Dale-Chall score.
     
@@ -151,16 +208,13 @@ def analyze_surah_dale_chall_readability():
     if file_path is None:
         project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
         file_path = os.path.join(project_root, "data", "quran-uthmani-min.txt")
-    loader = QuranDataLoader(file_path=file_path)
-    data = loader.load_data()
-    processor = TextPreprocessor()
-    surah_groups = {}
-    for item in data:
-        surah = str(item.get("surah", "Unknown"))
-        processed_text = processor.preprocess_text(item.get("verse_text", ""))
-        surah_groups.setdefault(surah, []).append(processed_text)
+    verses = load_preprocessed_verses(file_path)
+    surah_groups = defaultdict(list)
+    for surah, _, processed_text in verses:
+        surah_groups[surah].append(processed_text)
     surah_scores = {}
     for surah, texts in surah_groups.items():
+        surah = str(surah)
         full_text = "\n".join(texts)
         score = calculate_dale_chall_readability(full_text)
         logger.info("Surah %s Dale-Chall Readability Score: %f", surah, score)
@@ -171,7 +225,7 @@ def analyze_ayah_dale_chall_readability():
     '''
     Analyze the Dale-Chall Readability Score for each Ayah.
     
-    Loads the Quran data and for each Ayah, preprocesses the verse text,
+    Loads the preprocessed Quran verses and for each Ayah,
     computes the Dale-Chall score, logs the result with the Ayah identifier,
     and returns a dictionary mapping each Ayah (formatted as "surah|ayah") to its score.
     
@@ -182,14 +236,9 @@ def analyze_ayah_dale_chall_readability():
     if file_path is None:
         project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
         file_path = os.path.join(project_root, "data", "quran-uthmani-min.txt")
-    loader = QuranDataLoader(file_path=file_path)
-    data = loader.load_data()
-    processor = TextPreprocessor()
+    verses = load_preprocessed_verses(file_path)
     ayah_scores = {}
-    for item in data:
-        surah = str(item.get("surah", "Unknown"))
-        ayah = str(item.get("ayah", "Unknown"))
-        text = processor.preprocess_text(item.get("verse_text", ""))
+    for surah, ayah, text in verses:
         score = calculate_dale_chall_readability(text)
         identifier = f"{surah}|{ayah}"
         logger.info("Ayah %s Dale-Chall Readability Score: %f", identifier, score)
@@ -200,8 +249,9 @@ def analyze_quran_smog_index():
     '''
     Analyze the SMOG Index for the entire Quran text.
     
-    Loads the Quran data using QuranDataLoader, preprocesses the text using TextPreprocessor,
-    concatenates all verses into a single string, computes the SMOG Index, logs the result,
+    Loads the preprocessed Quran verses (shared across analyses via load_preprocessed_verses),
+    accumulates the readability counts verse by verse (treating each verse as a sentence, without
+    concatenating the whole text), computes the SMOG Index, logs the result,
     and returns the SMOG Index.
     
     :return: The SMOG Index for the entire Quran as a float.
@@ -211,11 +261,11 @@ def analyze_quran_smog_index():
     if file_path is None:
         project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
         file_path = os.path.join(project_root, "data", "quran-uthmani-min.txt")
-    loader = QuranDataLoader(file_path=file_path)
-    data = loader.load_data()
-    processor = TextPreprocessor()
-    all_text = "\n".join(processor.preprocess_text(item.get("verse_text", "")) for item in data)
-    index = calculate_smog_index(all_text)
+    verses = load_preprocessed_verses(file_path)
+    polysyllabic_word_count, sentence_count = count_smog_features(
+        (processed_text for _, _, processed_text in verses), polysyllabic_threshold=4
+    )
+    index = smog_index_from_counts(polysyllabic_word_count, sentence_count)
     logger.info("Quran SMOG Index: %f", index)
     return index
 
@@ -223,7 +273,7 @@ def analyze_surah_smog_index():
     '''
     Analyze the SMOG Index for each Surah.
     
-    Loads the Quran data, groups the verses by Surah, concatenates the preprocessed text for each Surah,
+    Loads the preprocessed Quran verses, groups them by Surah, concatenates the text for each Surah,
     computes the SMOG Index for each group, logs the results, and returns a dictionary mapping
     each Surah to its SMOG Index.
     
@@ -234,16 +284,13 @@ def analyze_surah_smog_index():
     if file_path is None:
         project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
         file_path = os.path.join(project_root, "data", "quran-uthmani-min.txt")
-    loader = QuranDataLoader(file_path=file_path)
-    data = loader.load_data()
-    processor = TextPreprocessor()
-    surah_groups = {}
-    for item in data:
-        surah = str(item.get("surah", "Unknown"))
-        processed_text = processor.preprocess_text(item.get("verse_text", ""))
-        surah_groups.setdefault(surah, []).append(processed_text)
+    verses = load_preprocessed_verses(file_path)
+    surah_groups = defaultdict(list)
+    for surah, _, processed_text in verses:
+        surah_groups[surah].append(processed_text)
     surah_indices = {}
     for surah, texts in surah_groups.items():
+        surah = str(surah)
         full_text = "\n".join(texts)
         index = calculate_smog_index(full_text)
         logger.info("Surah %s SMOG Index: %f", surah, index)
@@ -254,7 +301,7 @@ def analyze_ayah_smog_index():
     '''
     Analyze the SMOG Index for each Ayah.
     
-    Loads the Quran data and for each Ayah, preprocesses the verse text,
+    Loads the preprocessed Quran verses and for each Ayah,
     computes the SMOG Index, logs the result with the Ayah identifier,
     and returns a dictionary mapping each Ayah (formatted as "surah|ayah") to its SMOG Index.
     
@@ -265,14 +312,9 @@ def analyze_ayah_smog_index():
     if file_path is None:
         project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
         file_path = os.path.join(project_root, "data", "quran-uthmani-min.txt")
-    loader = QuranDataLoader(file_path=file_path)
-    data = loader.load_data()
-    processor = TextPreprocessor()
+    verses = load_preprocessed_verses(file_path)
     ayah_indices = {}
-    for item in data:
-        surah = str(item.get("surah", "Unknown"))
-        ayah = str(item.get("ayah", "Unknown"))
-        text = processor.preprocess_text(item.get("verse_text", ""))
+    for surah, ayah, text in verses:
         index = calculate_smog_index(text)
         identifier = f"{surah}|{ayah}"
         logger.info("Ayah %s SMOG Index: %f", identifier, index)
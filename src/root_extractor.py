@@ -2,6 +2,8 @@
 Module for Arabic root word extraction.
 '''
 
+from functools import lru_cache
+
 try:
     from camel_tools.morphology.analyzer import Analyzer
     _analyzer_instance = Analyzer.predefined('calima-msa')
@@ -12,14 +14,28 @@ def extract_root(token):
     '''
     Extract the root of the given Arabic token using CAMeL Tools morphological analysis.
     
+    Results are memoized per analyzer instance and token, so repeated tokens are analyzed only once.
+    
     :param token: The Arabic word token.
     :return: The extracted root form of the token.
     '''
     if _analyzer_instance is not None:
-        try:
-            analyses = _analyzer_instance.analyze(token)
-            if analyses and isinstance(analyses, list) and len(analyses) > 0:
-                return analyses[0].get('root', token)
-        except Exception:
-            return token
+        return _extract_root_with_analyzer(_analyzer_instance, token)
+    return token
+
+@lru_cache(maxsize=65536)
+def _extract_root_with_analyzer(analyzer, token):
+    '''
+    Extract the root of the token with the given analyzer; cached by (analyzer, token).
+    
+    :param analyzer: CAMeL Tools morphological analyzer instance.
+    :param token: The Arabic word token.
+    :return: The extracted root form of the token.
+    '''
+    try:
+        analyses = analyzer.analyze(token)
+        if analyses and isinstance(analyses, list) and len(analyses) > 0:
+            return analyses[0].get('root', token)
+    except Exception:
+        return token
     return token
\ No newline at end of file
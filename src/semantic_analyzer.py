@@ -26,8 +26,7 @@ def analyze_semantic_group_cooccurrence_ayah(quran_data):
     for ayah in quran_data:
         groups = ayah.get("semantic_groups", [])
         if groups and len(groups) > 1:
-            for pair in combinations(sorted(groups), 2):
-                cooccurrence_counter[pair] += 1
+            cooccurrence_counter.update(combinations(sorted(groups), 2))
     top_10 = cooccurrence_counter.most_common(10)
     logger.info("Top 10 semantic group co-occurrence pairs: %s", top_10)
     logger.info("Total unique semantic group co-occurrence pairs found: %d", len(cooccurrence_counter))
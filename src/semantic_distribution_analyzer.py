@@ -1,6 +1,7 @@
 import logging
 import statistics
 from collections import Counter
+import numpy as np
 
 from src.text_complexity_analyzer import analyze_text_complexity
 
@@ -52,21 +53,19 @@ def analyze_semantic_complexity_distribution_ayah(quran_data):
 
     # Compute quantile thresholds for semantic density across all ayahs
     densities = [entry[1] for entry in ayah_analysis]
-    fallback = False
-    if densities:
-        try:
-            boundaries = statistics.quantiles(densities, n=3)
-            low_medium_threshold = boundaries[0]
-            medium_high_threshold = boundaries[1]
-            if low_medium_threshold == medium_high_threshold:
-                raise ValueError("Quantile thresholds are equal. Insufficient variability in semantic densities.")
+    fallback = True
+    if len(densities) > 1:
+        low_medium_threshold, medium_high_threshold = statistics.quantiles(densities, n=3)
+        if low_medium_threshold != medium_high_threshold:
+            fallback = False
             logger.info("Semantic Density Quantile Boundaries: Low-Medium Threshold: %s, Medium-High Threshold: %s",
                         low_medium_threshold, medium_high_threshold)
-        except Exception as e:
-            logger.warning("Quantile calculation failed or insufficient variability. Applying fallback strategy: all ayahs assigned to 'medium'. Error: %s", str(e))
-            fallback = True
+        else:
+            fallback_message = "Quantile thresholds are equal. Insufficient variability in semantic densities."
     else:
-        fallback = True
+        fallback_message = "fewer than two ayahs"
+    if fallback and densities:
+        logger.warning("Quantile calculation failed or insufficient variability. Applying fallback strategy: all ayahs assigned to 'medium'. Error: %s", fallback_message)
 
     if fallback:
         low_medium_threshold = None
@@ -76,14 +75,24 @@ def analyze_semantic_complexity_distribution_ayah(quran_data):
             groups["medium"].append(complexity)
     else:
         groups = {"low": [], "medium": [], "high": []}
-        for ayah_id, density, complexity in ayah_analysis:
-            if density <= low_medium_threshold:
-                group = "low"
-            elif density <= medium_high_threshold:
-                group = "medium"
-            else:
-                group = "high"
-            groups[group].append(complexity)
+        group_names = ("low", "medium", "high")
+        # Bucket all densities in one call: index 0 for density <= low-medium threshold,
+        # 1 for density <= medium-high threshold, 2 otherwise.
+        group_ids = np.searchsorted([low_medium_threshold, medium_high_threshold], densities, side="left")
+        for (ayah_id, density, complexity), group_id in zip(ayah_analysis, group_ids.tolist()):
+            groups[group_names[group_id]].append(complexity)
+
+    def compute_stats(values):
+        if values:
+            mean_val = statistics.mean(values)
+            median_val = statistics.median(values)
+            stdev_val = statistics.stdev(values) if len(values) > 1 else 0
+            min_val = min(values)
+            max_val = max(values)
+            return {"mean": mean_val, "median": median_val, "stdev": stdev_val,
+                    "min": min_val, "max": max_val}
+        else:
+            return {"mean": 0, "median": 0, "stdev": 0, "min": 0, "max": 0}
 
     # Compute descriptive statistics for each group
     results = {}
@@ -92,18 +101,6 @@ def analyze_semantic_complexity_distribution_ayah(quran_data):
             avg_word_lengths = [comp["average_word_length"] for comp in complexities if "average_word_length" in comp]
             avg_sentence_lengths = [comp["average_sentence_length"] for comp in complexities if "average_sentence_length" in comp]
 
-            def compute_stats(values):
-                if values:
-                    mean_val = statistics.mean(values)
-                    median_val = statistics.median(values)
-                    stdev_val = statistics.stdev(values) if len(values) > 1 else 0
-                    min_val = min(values)
-                    max_val = max(values)
-                    return {"mean": mean_val, "median": median_val, "stdev": stdev_val,
-                            "min": min_val, "max": max_val}
-                else:
-                    return {"mean": 0, "median": 0, "stdev": 0, "min": 0, "max": 0}
-
             word_length_stats = compute_stats(avg_word_lengths)
             sentence_length_stats = compute_stats(avg_sentence_lengths)
             results[group_name] = {
@@ -1,4 +1,8 @@
 import logging
+from collections import defaultdict
+from functools import lru_cache
+from types import MappingProxyType
+import numpy as np
 from src.logger_config import configure_logger
 
 def analyze_text_complexity(text):
@@ -33,6 +37,26 @@ def analyze_text_complexity(text):
                 avg_word_length, avg_sentence_length)
     return {"average_word_length": avg_word_length, "average_sentence_length": avg_sentence_length}
 
+# Vowels used to approximate syllables; each is counted with str.count, a C-level substring search.
+FLESCH_VOWELS = "aeiouAEIOUاوي"
+
+def count_flesch_features(text):
+    '''
+    Count the words, sentences and syllables used by the Flesch formulas.
+    
+    Words are whitespace-separated tokens, sentences are the non-blank lines of the text (the whole text counts
+    as one sentence if there are none), and syllables are approximated as the number of vowels in the words.
+    Since vowels are never whitespace, the vowels in the words are exactly the vowels in the text, so they are
+    counted for the whole text at once with one str.count per vowel.
+    
+    :param text: Preprocessed text as a string.
+    :return: Tuple (total_words, total_sentences, total_syllables).
+    '''
+    total_words = len(text.split())
+    total_sentences = sum(1 for s in text.splitlines() if s.strip()) or 1
+    total_syllables = sum(map(text.count, FLESCH_VOWELS))
+    return total_words, total_sentences, total_syllables
+
 def calculate_flesch_reading_ease(text):
     '''
     Calculate the Flesch Reading Ease score for the given preprocessed text.
@@ -46,19 +70,19 @@ def calculate_flesch_reading_ease(text):
     :param text: Preprocessed text as a string.
     :return: Flesch Reading Ease score as a float.
     '''
-    vowels = set("aeiouAEIOUاوي")
-    words = text.split()
-    sentences = [s for s in text.splitlines() if s.strip()]
-    if not sentences:
-        sentences = [text]
-    total_words = len(words)
+    return flesch_reading_ease_from_counts(*count_flesch_features(text))
+
+def flesch_reading_ease_from_counts(total_words, total_sentences, total_syllables):
+    '''
+    Apply the Flesch Reading Ease formula to precomputed word, sentence and syllable counts.
+    
+    :param total_words: Number of words.
+    :param total_sentences: Number of sentences.
+    :param total_syllables: Number of syllables (vowels).
+    :return: Flesch Reading Ease score as a float (0.0 when there are no words).
+    '''
     if total_words == 0:
         return 0.0
-    total_sentences = len(sentences)
-    total_syllables = 0
-    for word in words:
-        syllable_count = sum(1 for c in word if c in vowels)
-        total_syllables += syllable_count
     avg_words_per_sentence = total_words / total_sentences if total_sentences > 0 else total_words
     avg_syllables_per_word = total_syllables / total_words
     score = 206.835 - 1.015 * avg_words_per_sentence - 84.6 * avg_syllables_per_word
@@ -77,43 +101,113 @@ def calculate_flesch_kincaid_grade_level(text):
     :param text: Preprocessed text as a string.
     :return: Flesch-Kincaid Grade Level score as a float.
     '''
-    vowels = set("aeiouAEIOUاوي")
-    words = text.split()
-    sentences = [s for s in text.splitlines() if s.strip()]
-    if not sentences:
-        sentences = [text]
-    total_words = len(words)
+    return flesch_kincaid_grade_level_from_counts(*count_flesch_features(text))
+
+def flesch_kincaid_grade_level_from_counts(total_words, total_sentences, total_syllables):
+    '''
+    Apply the Flesch-Kincaid Grade Level formula to precomputed word, sentence and syllable counts.
+    
+    :param total_words: Number of words.
+    :param total_sentences: Number of sentences.
+    :param total_syllables: Number of syllables (vowels).
+    :return: Flesch-Kincaid Grade Level as a float (0.0 when there are no words).
+    '''
     if total_words == 0:
         return 0.0
-    total_sentences = len(sentences)
-    total_syllables = sum(sum(1 for c in word if c in vowels) for word in words)
     avg_words_per_sentence = total_words / total_sentences if total_sentences > 0 else total_words
     avg_syllables_per_word = total_syllables / total_words
     grade = 0.39 * avg_words_per_sentence + 11.8 * avg_syllables_per_word - 14.59
     return grade
 
+def count_flesch_features_batch(texts):
+    '''
+    Count the Flesch words, sentences and syllables of each text as NumPy arrays.
+    
+    :param texts: Sequence of preprocessed texts.
+    :return: Tuple of float64 arrays (words, sentences, syllables), one entry per text.
+    '''
+    counts = np.array([count_flesch_features(text) for text in texts], dtype=np.float64).reshape(-1, 3)
+    return counts[:, 0], counts[:, 1], counts[:, 2]
+
+def calculate_flesch_reading_ease_batch(texts):
+    '''
+    Calculate the Flesch Reading Ease score of each text in one vectorized pass.
+    
+    Gives the same scores as calling calculate_flesch_reading_ease on each text
+    (texts without words score 0.0), with the formula evaluated once over arrays.
+    
+    :param texts: Sequence of preprocessed texts.
+    :return: List of Flesch Reading Ease scores as floats, in input order.
+    '''
+    words, sentences, syllables = count_flesch_features_batch(texts)
+    scores = 206.835 - 1.015 * (words / sentences) - 84.6 * (syllables / np.maximum(words, 1))
+    return np.where(words == 0, 0.0, scores).tolist()
+
+def calculate_flesch_kincaid_grade_level_batch(texts):
+    '''
+    Calculate the Flesch-Kincaid Grade Level of each text in one vectorized pass.
+    
+    Gives the same grades as calling calculate_flesch_kincaid_grade_level on each text
+    (texts without words grade 0.0), with the formula evaluated once over arrays.
+    
+    :param texts: Sequence of preprocessed texts.
+    :return: List of Flesch-Kincaid Grade Levels as floats, in input order.
+    '''
+    words, sentences, syllables = count_flesch_features_batch(texts)
+    grades = 0.39 * (words / sentences) + 11.8 * (syllables / np.maximum(words, 1)) - 14.59
+    return np.where(words == 0, 0.0, grades).tolist()
+
+@lru_cache(maxsize=4)
+def _count_quran_flesch_features(verses):
+    '''
+    Count the Flesch words, sentences and syllables of the whole Quran text.
+    
+    Shared by the Quran-level Flesch Reading Ease and Flesch-Kincaid analyses, and cached per
+    verses tuple, so running both analyses joins and scans the text only once.
+    
+    :param verses: Tuple of (surah, ayah, processed_text) tuples as returned by load_preprocessed_verses.
+    :return: Tuple (total_words, total_sentences, total_syllables).
+    '''
+    return count_flesch_features("\n".join(text for _, _, text in verses))
+
+@lru_cache(maxsize=4)
+def _count_surah_flesch_features(verses):
+    '''
+    Count the Flesch words, sentences and syllables of each Surah's concatenated text.
+    
+    Shared by the Surah-level Flesch Reading Ease and Flesch-Kincaid analyses, and cached per
+    verses tuple, so running both analyses scans each Surah's text only once. The cached result is
+    returned as a read-only mapping so no caller can change it for later ones.
+    
+    :param verses: Tuple of (surah, ayah, processed_text) tuples as returned by load_preprocessed_verses.
+    :return: Read-only mapping of Surah identifiers (as strings) to (total_words, total_sentences, total_syllables).
+    '''
+    surah_groups = defaultdict(list)
+    for surah, _, text in verses:
+        surah_groups[surah].append(text)
+    return MappingProxyType(
+        {str(surah): count_flesch_features("\n".join(texts)) for surah, texts in surah_groups.items()}
+    )
+
 def analyze_quran_flesch_reading_ease():
     '''
     Analyze and log the Flesch Reading Ease score for the entire Quran.
     
-    Loads the Quran data, concatenates the preprocessed text from all verses,
+    Loads the preprocessed Quran verses (shared across analyses via load_preprocessed_verses), counts the words,
+    sentences and syllables of their concatenated text (shared with the Flesch-Kincaid analysis),
     computes the Flesch Reading Ease score, logs the result, and returns the score.
     
     :return: Flesch Reading Ease score for the entire Quran as a float.
     '''
     import os
-    from src.data_loader import QuranDataLoader
-    from src.text_preprocessor import TextPreprocessor
+    from src.data_loader import load_preprocessed_verses
     logger = logging.getLogger("quran_analysis")
     file_path = os.getenv("DATA_FILE")
     if file_path is None:
         project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
         file_path = os.path.join(project_root, "data", "quran-uthmani-min.txt")
-    loader = QuranDataLoader(file_path=file_path)
-    data = loader.load_data()
-    processor = TextPreprocessor()
-    all_text = "\n".join(processor.preprocess_text(item.get("verse_text", "")) for item in data)
-    score = calculate_flesch_reading_ease(all_text)
+    verses = load_preprocessed_verses(file_path)
+    score = flesch_reading_ease_from_counts(*_count_quran_flesch_features(verses))
     logger.info("Quran Flesch Reading Ease Score: %.2f", score)
     return score
 
@@ -121,24 +215,21 @@ def analyze_quran_flesch_kincaid_grade_level():
     '''
     Analyze and log the Flesch-Kincaid Grade Level for the entire Quran.
     
-    Loads the Quran data, concatenates the preprocessed text from all verses,
+    Loads the preprocessed Quran verses (shared across analyses via load_preprocessed_verses), counts the words,
+    sentences and syllables of their concatenated text (shared with the Flesch Reading Ease analysis),
     computes the Flesch-Kincaid Grade Level, logs the result, and returns the grade level.
     
     :return: Flesch-Kincaid Grade Level for the entire Quran as a float.
     '''
     import os
-    from src.data_loader import QuranDataLoader
-    from src.text_preprocessor import TextPreprocessor
+    from src.data_loader import load_preprocessed_verses
     logger = logging.getLogger("quran_analysis")
     file_path = os.getenv("DATA_FILE")
     if file_path is None:
         project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
         file_path = os.path.join(project_root, "data", "quran-uthmani-min.txt")
-    loader = QuranDataLoader(file_path=file_path)
-    data = loader.load_data()
-    processor = TextPreprocessor()
-    all_text = "\n".join(processor.preprocess_text(item.get("verse_text", "")) for item in data)
-    grade = calculate_flesch_kincaid_grade_level(all_text)
+    verses = load_preprocessed_verses(file_path)
+    grade = flesch_kincaid_grade_level_from_counts(*_count_quran_flesch_features(verses))
     logger.info("Quran Flesch-Kincaid Grade Level: %.2f", grade)
     return grade
 
@@ -146,32 +237,23 @@ def analyze_surah_flesch_reading_ease():
     '''
     Analyze and log the Flesch Reading Ease score for each Surah.
     
-    Groups the Quran data by Surah, concatenates the preprocessed text for each Surah,
-    computes the Flesch Reading Ease score, logs the result for each Surah, and returns a dictionary
-    mapping each Surah to its score.
+    Counts the words, sentences and syllables of each Surah's concatenated preprocessed text
+    (shared with the Flesch-Kincaid analysis), computes the Flesch Reading Ease score,
+    logs the result for each Surah, and returns a dictionary mapping each Surah to its score.
     
     :return: Dictionary mapping Surah identifiers to Flesch Reading Ease scores.
     '''
     import os
-    from src.data_loader import QuranDataLoader
-    from src.text_preprocessor import TextPreprocessor
+    from src.data_loader import load_preprocessed_verses
     logger = logging.getLogger("quran_analysis")
     file_path = os.getenv("DATA_FILE")
     if file_path is None:
         project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
         file_path = os.path.join(project_root, "data", "quran-uthmani-min.txt")
-    loader = QuranDataLoader(file_path=file_path)
-    data = loader.load_data()
-    processor = TextPreprocessor()
+    verses = load_preprocessed_verses(file_path)
     surah_scores = {}
-    surah_groups = {}
-    for item in data:
-        surah = str(item.get("surah", "Unknown"))
-        text = processor.preprocess_text(item.get("verse_text", ""))
-        surah_groups.setdefault(surah, []).append(text)
-    for surah, texts in surah_groups.items():
-        full_text = "\n".join(texts)
-        score = calculate_flesch_reading_ease(full_text)
+    for surah, counts in _count_surah_flesch_features(verses).items():
+        score = flesch_reading_ease_from_counts(*counts)
         logger.info("Surah %s Flesch Reading Ease Score: %.2f", surah, score)
         surah_scores[surah] = score
     return surah_scores
@@ -180,32 +262,23 @@ def analyze_surah_flesch_kincaid_grade_level():
     '''
     Analyze and log the Flesch-Kincaid Grade Level for each Surah.
     
-    Groups the Quran data by Surah, concatenates the preprocessed text for each Surah,
-    computes the Flesch-Kincaid Grade Level, logs the result for each Surah, and returns a dictionary
-    mapping each Surah to its grade level.
+    Counts the words, sentences and syllables of each Surah's concatenated preprocessed text
+    (shared with the Flesch Reading Ease analysis), computes the Flesch-Kincaid Grade Level,
+    logs the result for each Surah, and returns a dictionary mapping each Surah to its grade level.
     
     :return: Dictionary mapping Surah identifiers to Flesch-Kincaid Grade Level scores.
     '''
     import os
-    from src.data_loader import QuranDataLoader
-    from src.text_preprocessor import TextPreprocessor
+    from src.data_loader import load_preprocessed_verses
     logger = logging.getLogger("quran_analysis")
     file_path = os.getenv("DATA_FILE")
     if file_path is None:
         project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
         file_path = os.path.join(project_root, "data", "quran-uthmani-min.txt")
-    loader = QuranDataLoader(file_path=file_path)
-    data = loader.load_data()
-    processor = TextPreprocessor()
+    verses = load_preprocessed_verses(file_path)
     surah_grades = {}
-    surah_groups = {}
-    for item in data:
-        surah = str(item.get("surah", "Unknown"))
-        text = processor.preprocess_text(item.get("verse_text", ""))
-        surah_groups.setdefault(surah, []).append(text)
-    for surah, texts in surah_groups.items():
-        full_text = "\n".join(texts)
-        grade = calculate_flesch_kincaid_grade_level(full_text)
+    for surah, counts in _count_surah_flesch_features(verses).items():
+        grade = flesch_kincaid_grade_level_from_counts(*counts)
         logger.info("Surah %s Flesch-Kincaid Grade Level: %.2f", surah, grade)
         surah_grades[surah] = grade
     return surah_grades
@@ -214,29 +287,23 @@ def analyze_ayah_flesch_reading_ease():
     '''
     Analyze and log the Flesch Reading Ease score for each Ayah.
     
-    Processes each Ayah individually, computes the Flesch Reading Ease score,
+    Computes the Flesch Reading Ease score of every Ayah in one vectorized batch,
     logs the result with its Surah and Ayah identifiers, and returns a dictionary
     mapping each Ayah (formatted as "surah|ayah") to its score.
     
     :return: Dictionary mapping Ayah identifiers to Flesch Reading Ease scores.
     '''
     import os
-    from src.data_loader import QuranDataLoader
-    from src.text_preprocessor import TextPreprocessor
+    from src.data_loader import load_preprocessed_verses
     logger = logging.getLogger("quran_analysis")
     file_path = os.getenv("DATA_FILE")
     if file_path is None:
         project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
         file_path = os.path.join(project_root, "data", "quran-uthmani-min.txt")
-    loader = QuranDataLoader(file_path=file_path)
-    data = loader.load_data()
-    processor = TextPreprocessor()
+    verses = load_preprocessed_verses(file_path)
+    scores = calculate_flesch_reading_ease_batch([text for _, _, text in verses])
     ayah_scores = {}
-    for item in data:
-        surah = str(item.get("surah", "Unknown"))
-        ayah = str(item.get("ayah", "Unknown"))
-        text = processor.preprocess_text(item.get("verse_text", ""))
-        score = calculate_flesch_reading_ease(text)
+    for (surah, ayah, _), score in zip(verses, scores):
         logger.info("Surah %s, Ayah %s Flesch Reading Ease Score: %.2f", surah, ayah, score)
         ayah_scores[f"{surah}|{ayah}"] = score
     return ayah_scores
@@ -245,29 +312,23 @@ def analyze_ayah_flesch_kincaid_grade_level():
     '''
     Analyze and log the Flesch-Kincaid Grade Level for each Ayah.
     
-    Processes each Ayah individually, computes the Flesch-Kincaid Grade Level,
+    Computes the Flesch-Kincaid Grade Level of every Ayah in one vectorized batch,
     logs the result with its Surah and Ayah identifiers, and returns a dictionary
     mapping each Ayah (formatted as "surah|ayah") to its grade level.
     
     :return: Dictionary mapping Ayah identifiers to Flesch-Kincaid Grade Level scores.
     '''
     import os
-    from src.data_loader import QuranDataLoader
-    from src.text_preprocessor import TextPreprocessor
+    from src.data_loader import load_preprocessed_verses
     logger = logging.getLogger("quran_analysis")
     file_path = os.getenv("DATA_FILE")
     if file_path is None:
         project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
         file_path = os.path.join(project_root, "data", "quran-uthmani-min.txt")
-    loader = QuranDataLoader(file_path=file_path)
-    data = loader.load_data()
-    processor = TextPreprocessor()
+    verses = load_preprocessed_verses(file_path)
+    grades = calculate_flesch_kincaid_grade_level_batch([text for _, _, text in verses])
     ayah_grades = {}
-    for item in data:
-        surah = str(item.get("surah", "Unknown"))
-        ayah = str(item.get("ayah", "Unknown"))
-        text = processor.preprocess_text(item.get("verse_text", ""))
-        grade = calculate_flesch_kincaid_grade_level(text)
+    for (surah, ayah, _), grade in zip(verses, grades):
         logger.info("Surah %s, Ayah %s Flesch-Kincaid Grade Level: %.2f", surah, ayah, grade)
         ayah_grades[f"{surah}|{ayah}"] = grade
     return ayah_grades
\ No newline at end of file
@@ -1,4 +1,5 @@
 import unicodedata
+from itertools import filterfalse
 
 class TextPreprocessor:
     '''
@@ -14,7 +15,7 @@ class TextPreprocessor:
         '''
         # Normalize text and remove diacritics
         normalized = unicodedata.normalize('NFKD', text)
-        filtered = ''.join([c for c in normalized if not unicodedata.combining(c)])
+        filtered = ''.join(filterfalse(unicodedata.combining, normalized))
         # Normalize specific letters: replace 'ى' with 'ي' and 'ة' with 'ه'
         filtered = filtered.replace("ى", "ي").replace("ة", "ه")
         return filtered.lower().strip()
@@ -2,7 +2,7 @@ import unittest
 import os
 import tempfile
 from unittest.mock import patch, MagicMock
-from src.data_loader import QuranDataLoader
+from src.data_loader import QuranDataLoader, load_preprocessed_verses
 
 class TestQuranDataLoader(unittest.TestCase):
     """
@@ -45,5 +45,34 @@ class TestQuranDataLoader(unittest.TestCase):
         self.assertEqual(data[1]["ayah"], 2)
         self.assertEqual(data[1]["verse_text"], "الْحَمْدُ لِلَّهِ رَبِّ الْعَالَمِينَ")
 
+    @patch('src.data_loader.get_morphology_analyzer')
+    def test_load_data_analyzes_each_distinct_token_once(self, mock_get_analyzer):
+        """
+        Test that load_data reuses the root and lemma of tokens it has already analyzed.
+        """
+        mock_analyzer = MagicMock()
+        mock_analyzer.analyze = MagicMock(side_effect=lambda token: [{'root': token + "_root", 'lex': token + "_lex"}])
+        mock_get_analyzer.return_value = mock_analyzer
+        with open(self.temp_file.name, "w", encoding="utf-8") as f:
+            f.write("1|1|كلمة اخرى كلمة\n")
+            f.write("1|2|اخرى\n")
+        data = QuranDataLoader(file_path=self.temp_file.name).load_data()
+        self.assertEqual(data[0]["roots"], ["كلمة_root", "اخرى_root", "كلمة_root"])
+        self.assertEqual(data[1]["lemmas"], ["اخرى_lex"])
+        self.assertEqual(mock_analyzer.analyze.call_count, 2)
+
+    def test_load_preprocessed_verses_cached(self):
+        """
+        Test that load_preprocessed_verses reuses its result and reloads a rewritten file.
+        """
+        verses = load_preprocessed_verses(self.temp_file.name)
+        self.assertEqual([(surah, ayah) for surah, ayah, _ in verses], [(1, 1), (1, 2)])
+        self.assertIs(load_preprocessed_verses(self.temp_file.name), verses)
+        
+        with open(self.temp_file.name, "a", encoding="utf-8") as f:
+            f.write("1|3|الرَّحْمَٰنِ الرَّحِيمِ\n")
+        reloaded = load_preprocessed_verses(self.temp_file.name)
+        self.assertEqual([(surah, ayah) for surah, ayah, _ in reloaded], [(1, 1), (1, 2), (1, 3)])
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,16 @@
+import unittest
+from src.frequency_analyzer import count_word_frequencies
+
+class TestFrequencyAnalyzer(unittest.TestCase):
+    '''
+    Unit tests for the word frequency counting helpers.
+    '''
+    def test_count_word_frequencies(self):
+        self.maxDiff = None
+        tokenized_text = [["بسم", "الله"], [], ["الله", "الرحمن", "الله"]]
+        result = count_word_frequencies(tokenized_text)
+        self.assertEqual(result, {"بسم": 1, "الله": 3, "الرحمن": 1})
+        self.assertIs(type(result), dict)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -16,5 +16,14 @@ class TestLemmatizer(unittest.TestCase):
         result = lemmatize_token(token)
         self.assertEqual(result, expected)
 
+    @patch('src.lemmatizer._lemmatizer_instance')
+    def test_lemmatize_token_memoized(self, mock_lemmatizer_instance):
+        self.maxDiff = None
+        mock_lemmatizer_instance.lemmatize = MagicMock(return_value="علم")
+        token = "العلماء"
+        self.assertEqual(lemmatize_token(token), "علم")
+        self.assertEqual(lemmatize_token(token), "علم")
+        mock_lemmatizer_instance.lemmatize.assert_called_once_with(token)
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
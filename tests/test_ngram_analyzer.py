@@ -1,6 +1,6 @@
 import unittest
 from collections import Counter
-from src.ngram_analyzer import analyze_character_ngrams, analyze_surah_character_ngrams, analyze_ayah_character_ngrams
+from src.ngram_analyzer import analyze_character_ngrams, analyze_surah_character_ngrams, analyze_ayah_character_ngrams, analyze_word_ngrams, analyze_ayah_word_ngrams
 
 class TestCharacterNGrams(unittest.TestCase):
     def test_analyze_character_ngrams_n2(self):
@@ -57,5 +57,27 @@ class TestCharacterNGrams(unittest.TestCase):
         }
         self.assertEqual({k: dict(v) for k, v in result.items()}, {k: dict(v) for k, v in expected.items()})
 
+    def test_analyze_word_ngrams(self):
+        self.maxDiff = None
+        # Pre-tokenized and string ayahs are both supported; ayahs shorter than n contribute nothing.
+        sample_data = [["a", "b", "a", "b"], "b a b", ["a"]]
+        result = analyze_word_ngrams(sample_data, n=2)
+        self.assertEqual(dict(result), {("a", "b"): 3, ("b", "a"): 2})
+        result = analyze_word_ngrams(sample_data, n=3)
+        self.assertEqual(dict(result), {("a", "b", "a"): 1, ("b", "a", "b"): 2})
+
+    def test_analyze_ayah_word_ngrams(self):
+        self.maxDiff = None
+        sample_data = [
+            {"surah": 1, "ayah": 1, "processed_text": "a b a b"},
+            {"surah": 1, "ayah": 2, "processed_text": "a"}
+        ]
+        result = analyze_ayah_word_ngrams(sample_data, n=2)
+        expected = {
+            "1|1": {("a", "b"): 2, ("b", "a"): 1},
+            "1|2": {}
+        }
+        self.assertEqual({k: dict(v) for k, v in result.items()}, expected)
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -1,8 +1,9 @@
 import io
 import logging
 import math
+import statistics
 import unittest
-from src.gematria_analyzer import get_default_gematria_mapping, analyze_surah_gematria_distribution, analyze_ayah_gematria_distribution, analyze_first_word_gematria_ayah, analyze_last_word_gematria_ayah
+from src.gematria_analyzer import get_default_gematria_mapping, analyze_surah_gematria_distribution, analyze_ayah_gematria_distribution, analyze_first_word_gematria_ayah, analyze_last_word_gematria_ayah, summarize_gematria_frequency
 
 class TestGematriaAnalyzer(unittest.TestCase):
     '''
@@ -138,6 +139,36 @@ class TestGematriaAnalyzer(unittest.TestCase):
         logs = log_stream.getvalue()
         self.assertIn("Top 10 most frequent Gematria values for last words:", logs)
 
+    def test_analyze_surah_gematria_distribution_non_integer_mapping(self):
+        self.maxDiff = None
+        # Custom mappings may use any numerical values, not only integers.
+        sample_data = [{"surah": "1", "ayah": "1", "processed_text": "a b b"}]
+        result = analyze_surah_gematria_distribution(sample_data, {"a": 1.5, "b": 2})
+        values = [1.5, 2, 2]
+        expected = {
+            "1": {
+                "frequency": {1.5: 1, 2: 2},
+                "summary": {
+                    "mean": statistics.mean(values),
+                    "median": statistics.median(values),
+                    "mode": statistics.mode(values),
+                    "stdev": statistics.stdev(values),
+                },
+            }
+        }
+        self.assertEqual(result, expected)
+
+    def test_summarize_gematria_frequency(self):
+        self.maxDiff = None
+        # Frequency {3: 2, 1: 1, 10: 1} expands to the values [3, 3, 1, 10].
+        mean_val, median_val, mode_val, stdev_val = summarize_gematria_frequency({3: 2, 1: 1, 10: 1})
+        self.assertEqual(mean_val, 4.25)
+        self.assertEqual(median_val, 3.0)
+        self.assertEqual(mode_val, 3)
+        self.assertEqual(stdev_val, statistics.stdev([3, 3, 1, 10]))
+        self.assertEqual(summarize_gematria_frequency({3: 2, 16: 1, 22: 1})[3], statistics.stdev([3, 3, 16, 22]))
+        self.assertEqual(summarize_gematria_frequency({}), (0, 0, 0, 0))
+
     def test_calculate_dale_chall_readability_empty(self):
         self.maxDiff = None
         from src.readability_analyzer import calculate_dale_chall_readability
@@ -193,5 +224,24 @@ class TestGematriaAnalyzer(unittest.TestCase):
         score = calculate_smog_index(text)
         self.assertAlmostEqual(score, expected, places=4)
 
+    def test_count_dale_chall_features(self):
+        self.maxDiff = None
+        from src.readability_analyzer import count_dale_chall_features
+        # Two non-empty sentences (the blank line is ignored): 5 words, 3 not in COMMON_ARABIC_WORDS.
+        text = "على الله\n   \nكلمة طويلة اختبار"
+        self.assertEqual(count_dale_chall_features((text,)), (5, 3, 2))
+        # Several texts are counted as if joined with newlines.
+        self.assertEqual(count_dale_chall_features(("على الله", "كلمة طويلة اختبار")), (5, 3, 2))
+        self.assertEqual(count_dale_chall_features(("",)), (0, 0, 0))
+
+    def test_count_smog_features(self):
+        self.maxDiff = None
+        from src.readability_analyzer import count_smog_features
+        # Two non-empty sentences; 2 words longer than 4 characters ("طويلة", "اختبار").
+        text = "على الله\n   \nكلمة طويلة اختبار"
+        self.assertEqual(count_smog_features((text,)), (2, 2))
+        self.assertEqual(count_smog_features(("على الله", "كلمة طويلة اختبار")), (2, 2))
+        self.assertEqual(count_smog_features(("",)), (0, 0))
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
@@ -25,5 +25,14 @@ class TestRootExtractor(unittest.TestCase):
         result = extract_root(token)
         self.assertEqual(result, expected)
 
+    @patch('src.root_extractor._analyzer_instance')
+    def test_extract_root_memoized(self, mock_analyzer_instance):
+        self.maxDiff = None
+        mock_analyzer_instance.analyze = MagicMock(return_value=[{'root': 'علم'}])
+        token = "العلماء"
+        self.assertEqual(extract_root(token), "علم")
+        self.assertEqual(extract_root(token), "علم")
+        mock_analyzer_instance.analyze.assert_called_once_with(token)
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
@@ -1,3 +1,4 @@
+import statistics
 import unittest
 from src.semantic_distribution_analyzer import analyze_semantic_complexity_distribution_ayah
 
@@ -88,5 +89,37 @@ class TestSemanticDistributionAnalyzer(unittest.TestCase):
         self.assertEqual(groups["medium"]["num_ayahs"], 2)
         self.assertEqual(groups["high"]["num_ayahs"], 0)
 
+    def test_group_statistics_match_statistics_module(self):
+        self.maxDiff = None
+        # Equal semantic densities put every ayah in "medium"; the average word lengths are chosen so
+        # that a float64 array mean would be 1 ulp below statistics.mean.
+        texts = ["sample statement a", "text a the of", "examples word example", "test", "word"]
+        sample_data = [
+            {"surah": "1", "ayah": str(i), "verse_text": text, "processed_text": text, "roots": ["A"]}
+            for i, text in enumerate(texts, start=1)
+        ]
+        result = analyze_semantic_complexity_distribution_ayah(sample_data)
+        medium = result["group_statistics"]["medium"]
+        word_lengths = [sum(map(len, text.split())) / len(text.split()) for text in texts]
+        sentence_lengths = [3, 4, 3, 1, 1]
+        self.assertEqual(medium["average_word_length_stats"], {
+            "mean": statistics.mean(word_lengths),
+            "median": statistics.median(word_lengths),
+            "stdev": statistics.stdev(word_lengths),
+            "min": min(word_lengths),
+            "max": max(word_lengths),
+        })
+        sentence_stats = medium["average_sentence_length_stats"]
+        self.assertEqual(sentence_stats, {
+            "mean": statistics.mean(sentence_lengths),
+            "median": statistics.median(sentence_lengths),
+            "stdev": statistics.stdev(sentence_lengths),
+            "min": 1,
+            "max": 4,
+        })
+        self.assertIs(type(sentence_stats["min"]), int)
+        self.assertIs(type(sentence_stats["max"]), int)
+        self.assertIs(type(sentence_stats["median"]), int)
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
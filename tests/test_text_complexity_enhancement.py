@@ -1,6 +1,11 @@
 import os
 import unittest
 from src.text_complexity_analyzer import (
+    count_flesch_features,
+    _count_surah_flesch_features,
+    _count_quran_flesch_features,
+    calculate_flesch_reading_ease_batch,
+    calculate_flesch_kincaid_grade_level_batch,
     calculate_flesch_reading_ease,
     calculate_flesch_kincaid_grade_level,
     analyze_quran_flesch_reading_ease,
@@ -42,6 +47,43 @@ class TestFleschMetrics(unittest.TestCase):
         grade = calculate_flesch_kincaid_grade_level(text)
         self.assertAlmostEqual(grade, -2.01, places=2)
 
+    def test_count_flesch_features(self):
+        self.maxDiff = None
+        # "I am happy." / blank line / "You are joyful." -> 6 words, 2 sentences,
+        # vowels: I, a, a, o, u, a, e, o, u = 9 syllables ("y" is not counted).
+        text = "I am happy.\n  \nYou are joyful."
+        self.assertEqual(count_flesch_features(text), (6, 2, 9))
+        # Text without non-blank lines still counts as one sentence.
+        self.assertEqual(count_flesch_features(""), (0, 1, 0))
+
+    def test_flesch_batch_matches_single_text_scores(self):
+        self.maxDiff = None
+        texts = ["I am happy.", "You are joyful.\nWe are here.", "", "بسم الله الرحمن الرحيم"]
+        self.assertEqual(calculate_flesch_reading_ease_batch(texts),
+                         [calculate_flesch_reading_ease(text) for text in texts])
+        self.assertEqual(calculate_flesch_kincaid_grade_level_batch(texts),
+                         [calculate_flesch_kincaid_grade_level(text) for text in texts])
+        self.assertEqual(calculate_flesch_reading_ease_batch([]), [])
+
+    def test_count_surah_flesch_features(self):
+        self.maxDiff = None
+        verses = ((1, 1, "I am happy."), (1, 2, "You are joyful."), (2, 1, "We go."))
+        expected = {
+            "1": count_flesch_features("I am happy.\nYou are joyful."),
+            "2": count_flesch_features("We go."),
+        }
+        counts = _count_surah_flesch_features(verses)
+        self.assertEqual(dict(counts), expected)
+        # The cached result is shared, so it must not be writable.
+        with self.assertRaises(TypeError):
+            counts["1"] = (0, 0, 0)
+
+    def test_count_quran_flesch_features(self):
+        self.maxDiff = None
+        verses = ((1, 1, "I am happy."), (1, 2, "You are joyful."), (2, 1, "We go."))
+        expected = count_flesch_features("I am happy.\nYou are joyful.\nWe go.")
+        self.assertEqual(_count_quran_flesch_features(verses), expected)
+
 class TestFleschIntegrationAnalysis(unittest.TestCase):
     '''Integration tests for Quran, Surah, and Ayah level Flesch analyses.'''
     def test_integration_quran_level(self):